@@ -1,3 +1,5 @@
+import logging
+import os
 import sys
 
 from PySide6.QtWidgets import QApplication, QMessageBox
@@ -16,6 +18,12 @@ except ImportError:
     print("[Telemetry] Database module not available - running in memory-only mode")
 
 if __name__ == '__main__':
+    # UI debug logging is off unless F1_HAWKEYE_DEBUG is set
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("F1_HAWKEYE_DEBUG") else logging.INFO,
+        format="[%(name)s] %(levelname)s: %(message)s"
+    )
+
     app = QApplication(sys.argv)
 
     with open("style.css", "r") as f:
@@ -19,7 +19,7 @@ from contextlib import contextmanager
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import create_engine, event, Index
+from sqlalchemy import create_engine, event, Index, select, func, case, or_
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.pool import QueuePool
 
@@ -291,6 +291,60 @@ class DatabaseManager:
                          .limit(limit)\
                          .all()
 
+    def get_tyre_stint_summaries(self, session_id: int, driver_index: int):
+        """
+        Get per-lap tyre wear for a driver, tagged with a stint number
+
+        Stints are identified in SQL: a new stint starts whenever tyre age
+        resets or the compound changes from the previous sample (a change to
+        or from a missing compound counts).
+
+        Args:
+            session_id: Database session ID
+            driver_index: Driver index (0-21)
+
+        Returns:
+            List of rows (stint_id, tyre_age_laps, avg_wear, wear_fl, wear_fr,
+            wear_rl, wear_rr, compound) ordered by lap
+        """
+        order = (TyreDataModel.lap_number, TyreDataModel.id)
+        prev_age = func.lag(TyreDataModel.tyre_age_laps).over(order_by=order)
+        prev_compound = func.lag(TyreDataModel.compound).over(order_by=order)
+
+        marked = select(
+            TyreDataModel.id,
+            TyreDataModel.lap_number,
+            TyreDataModel.tyre_age_laps,
+            TyreDataModel.wear_fl,
+            TyreDataModel.wear_fr,
+            TyreDataModel.wear_rl,
+            TyreDataModel.wear_rr,
+            TyreDataModel.compound,
+            case(
+                (or_(TyreDataModel.tyre_age_laps < prev_age,
+                     TyreDataModel.compound.is_distinct_from(prev_compound)), 1),
+                else_=0
+            ).label('new_stint')
+        ).where(
+            TyreDataModel.session_id == session_id,
+            TyreDataModel.driver_index == driver_index
+        ).subquery()
+
+        marked_order = (marked.c.lap_number, marked.c.id)
+        query = select(
+            func.sum(marked.c.new_stint).over(order_by=marked_order).label('stint_id'),
+            marked.c.tyre_age_laps,
+            ((marked.c.wear_fl + marked.c.wear_fr + marked.c.wear_rl + marked.c.wear_rr) / 4.0).label('avg_wear'),
+            marked.c.wear_fl,
+            marked.c.wear_fr,
+            marked.c.wear_rl,
+            marked.c.wear_rr,
+            marked.c.compound
+        ).order_by(*marked_order)
+
+        with self.get_session() as session:
+            return session.execute(query).all()
+
     def get_statistics(self) -> dict:
         """
         Get database statistics
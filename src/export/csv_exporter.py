@@ -18,7 +18,7 @@ Exports:
 
 import csv
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 from datetime import datetime
 
 from ..database import get_db_session
@@ -65,29 +65,64 @@ class CSVExporter:
         self.exported_files = []
 
         with get_db_session() as session:
-            # Get session metadata
-            session_model = session.query(SessionModel).get(session_id)
-            if not session_model:
-                raise ValueError(f"Session {session_id} not found")
-
-            # Create filename prefix
-            prefix = f"{session_model.track_name}_{session_model.session_type}_{session_model.created_at.strftime('%Y%m%d_%H%M%S')}"
-
-            # Export each data type
-            self._export_session_metadata(session_model, output_path, prefix)
-            self._export_laps(session_id, session, output_path, prefix)
-            self._export_tyre_data(session_id, session, output_path, prefix)
-            self._export_damage_events(session_id, session, output_path, prefix)
-            self._export_pit_stops(session_id, session, output_path, prefix)
-            self._export_weather_samples(session_id, session, output_path, prefix)
-
-            if include_telemetry:
-                print(f"[CSVExporter] WARNING: Exporting telemetry (can be 100MB+ file)")
-                self._export_telemetry(session_id, session, output_path, prefix)
+            self._export_session_using(session, session_id, output_path, include_telemetry)
 
         print(f"[CSVExporter] Exported {len(self.exported_files)} files to {output_dir}")
         return self.exported_files
 
+    def export_many(self,
+                    session_ids: List[int],
+                    output_dir: str = 'exports',
+                    include_telemetry: bool = False,
+                    report_progress: Optional[Callable[[int], None]] = None) -> List[str]:
+        """
+        Export several sessions through one database session
+
+        Args:
+            session_ids: Database session IDs
+            output_dir: Output directory path
+            include_telemetry: Export telemetry_snapshots (warning: huge file)
+            report_progress: Called with the number of sessions exported so far
+
+        Returns:
+            List of exported file paths
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        self.exported_files = []
+
+        with get_db_session() as session:
+            for done, session_id in enumerate(session_ids, start=1):
+                self._export_session_using(session, session_id, output_path, include_telemetry)
+                if report_progress is not None:
+                    report_progress(done)
+
+        print(f"[CSVExporter] Exported {len(self.exported_files)} files from {len(session_ids)} sessions to {output_dir}")
+        return self.exported_files
+
+    def _export_session_using(self, session, session_id, output_path, include_telemetry):
+        """Export one session's CSV files using an open database session"""
+        # Get session metadata
+        session_model = session.query(SessionModel).get(session_id)
+        if not session_model:
+            raise ValueError(f"Session {session_id} not found")
+
+        # Create filename prefix
+        prefix = f"{session_model.track_name}_{session_model.session_type}_{session_model.created_at.strftime('%Y%m%d_%H%M%S')}"
+
+        # Export each data type
+        self._export_session_metadata(session_model, output_path, prefix)
+        self._export_laps(session_id, session, output_path, prefix)
+        self._export_tyre_data(session_id, session, output_path, prefix)
+        self._export_damage_events(session_id, session, output_path, prefix)
+        self._export_pit_stops(session_id, session, output_path, prefix)
+        self._export_weather_samples(session_id, session, output_path, prefix)
+
+        if include_telemetry:
+            print(f"[CSVExporter] WARNING: Exporting telemetry (can be 100MB+ file)")
+            self._export_telemetry(session_id, session, output_path, prefix)
+
     def _export_session_metadata(self, session_model, output_path, prefix):
         """Export session metadata to CSV"""
         filename = output_path / f"{prefix}_session.csv"
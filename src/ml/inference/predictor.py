@@ -33,6 +33,16 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 from ..models import (
     TyreWearModel,
     LapTimeModel,
@@ -42,6 +52,29 @@ from ..models import (
 )
 
 
+class OnnxRegressor:
+    """Drop-in replacement for a fitted regressor's predict(), backed by ONNX Runtime"""
+
+    def __init__(self, estimator):
+        n_features = estimator.n_features_in_
+        onnx_model = convert_sklearn(estimator, initial_types=[('input', FloatTensorType([None, n_features]))])
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            onnx_model.SerializeToString(), options, providers=['CPUExecutionProvider']
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.n_features_in_ = n_features
+
+        # Warm up so the first live prediction doesn't pay session setup
+        self.predict(np.zeros((1, n_features)))
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        return self.session.run(None, {self.input_name: X})[0].ravel()
+
+
 class RealTimePredictor:
     """
     Real-time prediction engine
@@ -107,6 +140,26 @@ class RealTimePredictor:
         self.models_loaded = True
         print(f"[RealTimePredictor] Models loaded successfully")
 
+    def compile_all(self):
+        """
+        Compile loaded regressors to ONNX Runtime sessions for faster inference
+
+        Models that can't be converted (or when skl2onnx/onnxruntime aren't
+        installed) keep their original estimator.
+        """
+        if not ONNX_AVAILABLE:
+            print("[RealTimePredictor] ONNX Runtime not available - using original models")
+            return
+
+        for name, model in (('tyre wear', self.tyre_model), ('lap time', self.lap_time_model)):
+            if model is None or model.model is None or isinstance(model.model, OnnxRegressor):
+                continue
+            try:
+                model.model = OnnxRegressor(model.model)
+                print(f"  ✓ Compiled {name} model to ONNX")
+            except Exception as e:
+                print(f"  ✗ Kept {name} model uncompiled: {e}")
+
     def predict(self, current_state: Dict) -> Dict:
         """
         Make real-time predictions
@@ -9,6 +9,7 @@ Models:
 - PitStopOptimizer: Pit stop timing optimization
 - RaceOutcomeModel: Win/podium/points probability prediction
 - StrategyRecommender: Comprehensive race strategy recommendations
+- featurize_state: Shared race state inputs for the strategy models
 
 Usage:
     from src.ml.models import TyreWearModel, LapTimeModel, StrategyRecommender
@@ -28,11 +29,16 @@ from .lap_time_model import LapTimeModel
 from .pit_stop_optimizer import PitStopOptimizer
 from .race_outcome_model import RaceOutcomeModel
 from .strategy_model import StrategyRecommender
+from .race_features import STATE_FIELDS, RaceFeatures, featurize_state, state_key
 
 __all__ = [
     'TyreWearModel',
     'LapTimeModel',
     'PitStopOptimizer',
     'RaceOutcomeModel',
-    'StrategyRecommender'
+    'StrategyRecommender',
+    'STATE_FIELDS',
+    'RaceFeatures',
+    'featurize_state',
+    'state_key'
 ]
@@ -27,6 +27,80 @@ import numpy as np
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from .race_features import RaceFeatures, featurize_state
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing: run the plain Python function"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _stint_time(num_laps, starting_tyre_age, base_lap_time, degradation_per_lap):
+    """Calculate total time for a stint with tyre degradation"""
+    total_time = 0.0
+
+    for lap in range(num_laps):
+        current_tyre_age = starting_tyre_age + lap
+
+        # Degradation effect (quadratic after certain age)
+        if current_tyre_age < 10:
+            degradation = degradation_per_lap * current_tyre_age
+        else:
+            # Accelerated degradation
+            degradation = degradation_per_lap * (10 + 1.5 * (current_tyre_age - 10))
+
+        total_time += base_lap_time + degradation
+
+    return total_time
+
+
+@njit(parallel=True, cache=True)
+def _score_pit_laps(pit_laps, current_lap, total_laps, tyre_age, current_position,
+                    base_lap_time, pit_loss_time, degradation_per_lap, fresh_tyre_advantage,
+                    num_simulations):
+    """
+    Monte Carlo expected position and race time for each candidate pit lap
+
+    Returns:
+        (expected_positions, expected_race_times) arrays aligned with pit_laps
+    """
+    n = pit_laps.shape[0]
+    positions = np.empty(n)
+    race_times = np.empty(n)
+
+    for i in prange(n):
+        laps_to_pit = pit_laps[i] - current_lap
+        laps_after_pit = total_laps - pit_laps[i]
+
+        # Stint times are deterministic: before pit on current tyres, after pit on fresh ones
+        stint_time = (
+            _stint_time(laps_to_pit, tyre_age, base_lap_time, degradation_per_lap)
+            + _stint_time(laps_after_pit, 0, base_lap_time - fresh_tyre_advantage, degradation_per_lap)
+        )
+
+        # Position gain from fresh tyres minus position loss from the stop
+        net_change = (fresh_tyre_advantage * laps_after_pit - pit_loss_time) / base_lap_time
+
+        time_sum = 0.0
+        position_sum = 0.0
+        for _ in range(num_simulations):
+            time_sum += stint_time + pit_loss_time + np.random.normal(0.0, 500.0)  # +/- 0.5s pit variability
+            position_sum += max(1.0, current_position - (net_change + np.random.normal(0.0, 0.5)))
+
+        race_times[i] = time_sum / num_simulations
+        positions[i] = position_sum / num_simulations
+
+    return positions, race_times
+
 
 @dataclass
 class PitStopScenario:
@@ -64,7 +138,8 @@ class PitStopOptimizer:
         self,
         current_state: Dict,
         candidate_laps: Optional[List[int]] = None,
-        num_simulations: int = 1000
+        num_simulations: int = 1000,
+        features: Optional[RaceFeatures] = None
     ) -> Dict:
         """
         Find optimal pit stop lap
@@ -73,14 +148,17 @@ class PitStopOptimizer:
             current_state: Current race state
             candidate_laps: List of laps to consider (None = auto-generate)
             num_simulations: Number of Monte Carlo simulations
+            features: Precomputed featurize_state(current_state), shared with other models
 
         Returns:
             Optimization result with recommended pit lap
         """
-        current_lap = current_state['current_lap']
-        total_laps = current_state['total_laps']
-        tyre_age = current_state.get('tyre_age', 0)
-        current_position = current_state.get('current_position', 10)
+        if features is None:
+            features = featurize_state(current_state)
+        current_lap = features.current_lap
+        total_laps = features.total_laps
+        tyre_age = features.tyre_age
+        current_position = features.current_position
 
         # Generate candidate pit laps if not provided
         if candidate_laps is None:
@@ -90,15 +168,23 @@ class PitStopOptimizer:
 
         print(f"[PitStopOptimizer] Evaluating {len(candidate_laps)} pit windows...")
 
-        # Simulate each candidate lap
-        scenarios = []
-        for pit_lap in candidate_laps:
-            scenario = self._simulate_pit_stop(
-                current_state,
-                pit_lap,
-                num_simulations
-            )
-            scenarios.append(scenario)
+        # Simulate all candidate laps in one compiled pass
+        positions, race_times = _score_pit_laps(
+            np.asarray(candidate_laps, dtype=np.int64),
+            current_lap,
+            total_laps,
+            tyre_age,
+            float(current_position),
+            float(features.base_lap_time),
+            float(self.pit_loss_time),
+            float(self.degradation_per_lap),
+            float(self.fresh_tyre_advantage),
+            num_simulations
+        )
+        scenarios = [
+            self._build_scenario(features, pit_lap, positions[i], race_times[i])
+            for i, pit_lap in enumerate(candidate_laps)
+        ]
 
         # Find optimal scenario (minimize race time, then position)
         scenarios.sort(key=lambda s: (s.expected_position, s.expected_race_time))
@@ -136,75 +222,19 @@ class PitStopOptimizer:
 
         return result
 
-    def _simulate_pit_stop(
+    def _build_scenario(
         self,
-        current_state: Dict,
+        features: RaceFeatures,
         pit_lap: int,
-        num_simulations: int
+        expected_position: float,
+        expected_race_time: float
     ) -> PitStopScenario:
-        """
-        Simulate a pit stop at specific lap
-
-        Uses Monte Carlo to account for variability.
-        """
-        current_lap = current_state['current_lap']
-        total_laps = current_state['total_laps']
-        tyre_age = current_state.get('tyre_age', 0)
-        current_position = current_state.get('current_position', 10)
-        base_lap_time = current_state.get('base_lap_time', 90000)  # 1:30 default
-
+        """Build a scenario from the simulated position and race time for a pit lap"""
         # Laps until pit
-        laps_to_pit = pit_lap - current_lap
+        laps_to_pit = pit_lap - features.current_lap
 
         # Laps after pit
-        laps_after_pit = total_laps - pit_lap
-
-        # Run simulations
-        positions = []
-        race_times = []
-
-        for _ in range(num_simulations):
-            # Phase 1: Before pit (on current tyres)
-            tyre_age_at_pit = tyre_age + laps_to_pit
-            phase1_time = self._calculate_stint_time(
-                laps_to_pit,
-                tyre_age,
-                base_lap_time
-            )
-
-            # Pit stop
-            pit_time = self.pit_loss_time + np.random.normal(0, 500)  # +/- 0.5s variability
-
-            # Phase 2: After pit (on fresh tyres)
-            phase2_time = self._calculate_stint_time(
-                laps_after_pit,
-                0,  # Fresh tyres
-                base_lap_time - self.fresh_tyre_advantage
-            )
-
-            # Total race time
-            total_time = phase1_time + pit_time + phase2_time
-            race_times.append(total_time)
-
-            # Estimate position (simplified model)
-            # Position loss from pit stop
-            position_loss = self.pit_loss_time / base_lap_time
-
-            # Position gain from fresh tyres
-            position_gain = (self.fresh_tyre_advantage * laps_after_pit) / base_lap_time
-
-            # Net position change
-            net_change = position_gain - position_loss
-
-            # Add variability
-            net_change += np.random.normal(0, 0.5)
-
-            estimated_position = max(1, current_position - net_change)
-            positions.append(estimated_position)
-
-        # Calculate scenario metrics
-        expected_position = np.mean(positions)
-        expected_race_time = np.mean(race_times)
+        laps_after_pit = features.total_laps - pit_lap
 
         # Tyre life at end
         tyre_life_at_end = max(0, self.max_tyre_life - laps_after_pit)
@@ -232,32 +262,6 @@ class PitStopOptimizer:
             risk_score=risk_score
         )
 
-    def _calculate_stint_time(
-        self,
-        num_laps: int,
-        starting_tyre_age: int,
-        base_lap_time: float
-    ) -> float:
-        """Calculate total time for a stint with tyre degradation"""
-        total_time = 0
-
-        for lap in range(num_laps):
-            current_tyre_age = starting_tyre_age + lap
-
-            # Degradation effect (quadratic after certain age)
-            if current_tyre_age < 10:
-                degradation = self.degradation_per_lap * current_tyre_age
-            else:
-                # Accelerated degradation
-                degradation = self.degradation_per_lap * (
-                    10 + 1.5 * (current_tyre_age - 10)
-                )
-
-            lap_time = base_lap_time + degradation
-            total_time += lap_time
-
-        return total_time
-
     def _calculate_risk(
         self,
         laps_after_pit: int,
@@ -317,6 +321,10 @@ class PitStopOptimizer:
             f"Risk level: {'HIGH' if scenario.risk_score > 0.5 else 'LOW'}."
         )
 
+    def warm_up(self):
+        """Compile the scoring kernel ahead of the first real optimization"""
+        _score_pit_laps(np.array([2, 3], dtype=np.int64), 1, 4, 0, 1.0, 90000.0, 25000.0, 50.0, 1500.0, 1)
+
     def evaluate_competitor_strategies(
         self,
         current_state: Dict,
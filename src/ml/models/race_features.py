@@ -0,0 +1,61 @@
+"""
+Race State Features
+
+Scalar inputs shared by the strategy models, read once from a race state dict.
+
+Usage:
+    from src.ml.models import featurize_state
+
+    features = featurize_state(current_state)
+    recommender.recommend_strategy(current_state, features=features)
+    pit_optimizer.optimize_pit_window(current_state, features=features)
+"""
+
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+
+# State fields the strategy models read, in state_key() order
+STATE_FIELDS = ('current_lap', 'total_laps', 'current_position', 'current_compound', 'tyre_age', 'base_lap_time')
+
+
+class RaceFeatures(NamedTuple):
+    """Race state inputs with defaults applied"""
+    current_lap: int
+    total_laps: int
+    current_position: int
+    current_compound: str
+    tyre_age: int
+    base_lap_time: float
+    laps_remaining: int
+
+
+def state_key(state: Dict) -> Tuple:
+    """Hashable key of the state fields the strategy models read"""
+    return (
+        state.get('current_lap', 0),
+        state.get('total_laps', 50),
+        state.get('current_position', 10),
+        state.get('current_compound', 'MEDIUM'),
+        state.get('tyre_age', 0),
+        state.get('base_lap_time', 90000)  # 1:30 default
+    )
+
+
+@lru_cache(maxsize=32)
+def _featurize(key: Tuple) -> RaceFeatures:
+    current_lap, total_laps = key[0], key[1]
+    return RaceFeatures(*key, laps_remaining=total_laps - current_lap)
+
+
+def featurize_state(state: Dict) -> RaceFeatures:
+    """
+    Build the shared features for a race state
+
+    Args:
+        state: Current race state
+
+    Returns:
+        RaceFeatures for the state
+    """
+    return _featurize(state_key(state))
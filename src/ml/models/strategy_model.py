@@ -28,6 +28,7 @@ from .tyre_wear_model import TyreWearModel
 from .lap_time_model import LapTimeModel
 from .pit_stop_optimizer import PitStopOptimizer
 from .race_outcome_model import RaceOutcomeModel
+from .race_features import RaceFeatures, featurize_state
 
 
 @dataclass
@@ -77,7 +78,8 @@ class StrategyRecommender:
     def recommend_strategy(
         self,
         current_state: Dict,
-        max_strategies: int = 5
+        max_strategies: int = 5,
+        features: Optional[RaceFeatures] = None
     ) -> Dict:
         """
         Recommend race strategies
@@ -85,35 +87,35 @@ class StrategyRecommender:
         Args:
             current_state: Current race state
             max_strategies: Maximum number of strategies to return
+            features: Precomputed featurize_state(current_state), shared with other models
 
         Returns:
             Strategy recommendations with analysis
         """
         print(f"[StrategyRecommender] Analyzing race strategies...")
 
-        current_lap = current_state.get('current_lap', 0)
-        total_laps = current_state.get('total_laps', 50)
-        current_position = current_state.get('current_position', 10)
-        current_compound = current_state.get('current_compound', 'MEDIUM')
+        if features is None:
+            features = featurize_state(current_state)
+        total_laps = features.total_laps
 
         # Generate candidate strategies
         strategies = []
 
         # 1-stop strategies
-        strategies.extend(self._generate_one_stop_strategies(current_state))
+        strategies.extend(self._generate_one_stop_strategies(features))
 
         # 2-stop strategies (if race is long enough)
         if total_laps >= 40:
-            strategies.extend(self._generate_two_stop_strategies(current_state))
+            strategies.extend(self._generate_two_stop_strategies(features))
 
         # 0-stop strategy (if possible)
-        if self._is_zero_stop_viable(current_state):
-            strategies.append(self._generate_zero_stop_strategy(current_state))
+        if self._is_zero_stop_viable(features):
+            strategies.append(self._generate_zero_stop_strategy(features))
 
         # Evaluate each strategy
         evaluated_strategies = []
         for strategy in strategies:
-            evaluation = self._evaluate_strategy(strategy, current_state)
+            evaluation = self._evaluate_strategy(strategy, current_state, features)
             evaluated_strategies.append(evaluation)
 
         # Sort by expected outcome (podium prob, then position)
@@ -139,17 +141,17 @@ class StrategyRecommender:
             'analysis': {
                 'total_strategies_evaluated': len(strategies),
                 'best_pit_window': top_strategies[0].pit_laps[0] if top_strategies and top_strategies[0].pit_laps else None,
-                'risk_assessment': self._assess_overall_risk(current_state)
+                'risk_assessment': self._assess_overall_risk(features)
             }
         }
 
-    def _generate_one_stop_strategies(self, state: Dict) -> List[Dict]:
+    def _generate_one_stop_strategies(self, features: RaceFeatures) -> List[Dict]:
         """Generate 1-stop strategy candidates"""
         strategies = []
 
-        current_lap = state.get('current_lap', 0)
-        total_laps = state.get('total_laps', 50)
-        current_compound = state.get('current_compound', 'MEDIUM')
+        current_lap = features.current_lap
+        total_laps = features.total_laps
+        current_compound = features.current_compound
 
         # Available compounds (must use 2 different compounds in race)
         available_compounds = [c for c in ['SOFT', 'MEDIUM', 'HARD'] if c != current_compound]
@@ -188,13 +190,13 @@ class StrategyRecommender:
 
         return strategies
 
-    def _generate_two_stop_strategies(self, state: Dict) -> List[Dict]:
+    def _generate_two_stop_strategies(self, features: RaceFeatures) -> List[Dict]:
         """Generate 2-stop strategy candidates"""
         strategies = []
 
-        current_lap = state.get('current_lap', 0)
-        total_laps = state.get('total_laps', 50)
-        current_compound = state.get('current_compound', 'MEDIUM')
+        current_lap = features.current_lap
+        total_laps = features.total_laps
+        current_compound = features.current_compound
 
         # Only consider 2-stop if enough laps remaining
         laps_remaining = total_laps - current_lap
@@ -239,9 +241,9 @@ class StrategyRecommender:
 
         return strategies
 
-    def _generate_zero_stop_strategy(self, state: Dict) -> Dict:
+    def _generate_zero_stop_strategy(self, features: RaceFeatures) -> Dict:
         """Generate 0-stop strategy (if viable)"""
-        current_compound = state.get('current_compound', 'MEDIUM')
+        current_compound = features.current_compound
 
         return {
             'name': f'0-stop {current_compound} (No Stop)',
@@ -250,12 +252,12 @@ class StrategyRecommender:
             'pit_laps': []
         }
 
-    def _is_zero_stop_viable(self, state: Dict) -> bool:
+    def _is_zero_stop_viable(self, features: RaceFeatures) -> bool:
         """Check if 0-stop strategy is viable"""
-        tyre_age = state.get('tyre_age', 0)
-        total_laps = state.get('total_laps', 50)
-        current_lap = state.get('current_lap', 0)
-        current_compound = state.get('current_compound', 'MEDIUM')
+        tyre_age = features.tyre_age
+        total_laps = features.total_laps
+        current_lap = features.current_lap
+        current_compound = features.current_compound
 
         laps_remaining = total_laps - current_lap
         projected_tyre_age = tyre_age + laps_remaining
@@ -268,19 +270,20 @@ class StrategyRecommender:
     def _evaluate_strategy(
         self,
         strategy: Dict,
-        current_state: Dict
+        current_state: Dict,
+        features: RaceFeatures
     ) -> StrategyOption:
         """Evaluate a strategy option"""
         # Simulate the strategy
-        race_time = self._simulate_strategy_race_time(strategy, current_state)
-        expected_position = self._simulate_strategy_position(strategy, current_state)
+        race_time = self._simulate_strategy_race_time(strategy, features)
+        expected_position = self._simulate_strategy_position(strategy, features)
 
         # Predict outcome probabilities
         # Create state for outcome prediction
         outcome_state = {
             **current_state,
             'expected_position': expected_position,
-            'strategy_risk': self._calculate_strategy_risk(strategy, current_state)
+            'strategy_risk': self._calculate_strategy_risk(strategy, features)
         }
 
         # Calculate outcome probabilities (simplified)
@@ -300,13 +303,13 @@ class StrategyRecommender:
         points_prob = 0.95 if expected_position <= 10 else 0.30
 
         # Risk level
-        risk_level = self._calculate_risk_level(strategy, current_state)
+        risk_level = self._calculate_risk_level(strategy, features)
 
         # Confidence
-        confidence = self._calculate_strategy_confidence(strategy, current_state)
+        confidence = self._calculate_strategy_confidence(strategy, features)
 
         # Reasoning
-        reasoning = self._generate_strategy_reasoning(strategy, current_state, expected_position)
+        reasoning = self._generate_strategy_reasoning(strategy, features, expected_position)
 
         return StrategyOption(
             name=strategy['name'],
@@ -323,11 +326,11 @@ class StrategyRecommender:
             reasoning=reasoning
         )
 
-    def _simulate_strategy_race_time(self, strategy: Dict, state: Dict) -> float:
+    def _simulate_strategy_race_time(self, strategy: Dict, features: RaceFeatures) -> float:
         """Simulate total race time for a strategy"""
-        total_laps = state.get('total_laps', 50)
-        current_lap = state.get('current_lap', 0)
-        base_lap_time = state.get('base_lap_time', 90000)  # 1:30 default
+        total_laps = features.total_laps
+        current_lap = features.current_lap
+        base_lap_time = features.base_lap_time
 
         laps_remaining = total_laps - current_lap
         total_time = 0
@@ -378,9 +381,9 @@ class StrategyRecommender:
             total += lap_time
         return total
 
-    def _simulate_strategy_position(self, strategy: Dict, state: Dict) -> int:
+    def _simulate_strategy_position(self, strategy: Dict, features: RaceFeatures) -> int:
         """Simulate expected position for strategy"""
-        current_position = state.get('current_position', 10)
+        current_position = features.current_position
 
         # Simplified position change based on pit stops
         # More pit stops = higher risk but potentially better pace
@@ -404,7 +407,7 @@ class StrategyRecommender:
 
         return max(1, min(20, int(round(expected_position))))
 
-    def _calculate_strategy_risk(self, strategy: Dict, state: Dict) -> float:
+    def _calculate_strategy_risk(self, strategy: Dict, features: RaceFeatures) -> float:
         """Calculate strategy risk score"""
         risk = 0.0
 
@@ -417,17 +420,17 @@ class StrategyRecommender:
 
         # Long stints = more risk
         if strategy['pit_laps']:
-            for i, pit_lap in enumerate(strategy['pit_laps'] + [state.get('total_laps', 50)]):
-                start_lap = strategy['pit_laps'][i - 1] if i > 0 else state.get('current_lap', 0)
+            for i, pit_lap in enumerate(strategy['pit_laps'] + [features.total_laps]):
+                start_lap = strategy['pit_laps'][i - 1] if i > 0 else features.current_lap
                 stint_length = pit_lap - start_lap
                 if stint_length > 30:
                     risk += 0.2
 
         return min(1.0, risk)
 
-    def _calculate_risk_level(self, strategy: Dict, state: Dict) -> str:
+    def _calculate_risk_level(self, strategy: Dict, features: RaceFeatures) -> str:
         """Calculate risk level string"""
-        risk = self._calculate_strategy_risk(strategy, state)
+        risk = self._calculate_strategy_risk(strategy, features)
 
         if risk < 0.3:
             return 'LOW'
@@ -436,7 +439,7 @@ class StrategyRecommender:
         else:
             return 'HIGH'
 
-    def _calculate_strategy_confidence(self, strategy: Dict, state: Dict) -> float:
+    def _calculate_strategy_confidence(self, strategy: Dict, features: RaceFeatures) -> float:
         """Calculate confidence in strategy recommendation"""
         # Higher confidence for standard strategies
         if strategy['pit_stops'] == 1:
@@ -449,14 +452,14 @@ class StrategyRecommender:
     def _generate_strategy_reasoning(
         self,
         strategy: Dict,
-        state: Dict,
+        features: RaceFeatures,
         expected_position: int
     ) -> str:
         """Generate reasoning for strategy"""
         parts = []
 
         # Position expectation
-        current_pos = state.get('current_position', 10)
+        current_pos = features.current_position
         if expected_position < current_pos:
             parts.append(f"Expected to gain {current_pos - expected_position} position(s)")
         elif expected_position > current_pos:
@@ -474,11 +477,11 @@ class StrategyRecommender:
 
         return '. '.join(parts) + '.'
 
-    def _assess_overall_risk(self, state: Dict) -> str:
+    def _assess_overall_risk(self, features: RaceFeatures) -> str:
         """Assess overall race risk"""
-        position = state.get('current_position', 10)
-        lap = state.get('current_lap', 0)
-        total = state.get('total_laps', 50)
+        position = features.current_position
+        lap = features.current_lap
+        total = features.total_laps
 
         if lap < total * 0.3:
             return 'Early race - conservative approach recommended'
@@ -34,6 +34,9 @@ class Listener:
         header = PacketHeader.from_buffer_copy(packet)
         return header, HEADER_FIELD_TO_PACKET_TYPE[header.m_packet_id].from_buffer_copy(packet)
 
+    def fileno(self):
+        return self.socket.fileno()
+
     def close(self):
         self.socket.close()
     
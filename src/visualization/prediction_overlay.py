@@ -22,7 +22,7 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal
 from typing import Dict, List, Optional
 
 try:
@@ -39,6 +39,8 @@ class PredictionOverlay(QWidget):
     Shows live ML predictions with confidence indicators.
     """
 
+    refresh_requested = Signal()  # auto-refresh tick
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -54,6 +56,7 @@ class PredictionOverlay(QWidget):
 
         # Predictor
         self.predictor: Optional[RealTimePredictor] = None
+        self._last_predictions: Optional[Dict] = None
 
         # Data history
         self.history = {
@@ -131,19 +134,23 @@ class PredictionOverlay(QWidget):
         self.predictor = predictor
         self.status_label.setText("Predictions: Connected")
 
-    def update(self, current_state: Dict):
+    def update(self, current_state: Dict, predictions: Optional[Dict] = None):
         """
         Update predictions with current state
 
         Args:
             current_state: Current race state
+            predictions: Previously computed predictions for this state (skips inference)
         """
         if not self.predictor:
             return
 
+        self._last_predictions = None
         try:
             # Get predictions
-            predictions = self.predictor.predict(current_state)
+            if predictions is None:
+                predictions = self.predictor.predict(current_state)
+            self._last_predictions = predictions
 
             current_lap = current_state.get('current_lap', 0)
 
@@ -183,6 +190,10 @@ class PredictionOverlay(QWidget):
             print(f"Error updating predictions: {e}")
             self.status_label.setText(f"Predictions: Error - {str(e)[:50]}")
 
+    def get_last_predictions(self) -> Optional[Dict]:
+        """Predictions produced by the most recent update"""
+        return self._last_predictions
+
     def _update_plots(self):
         """Update all plots with latest data"""
         # Tyre wear
@@ -310,8 +321,8 @@ class PredictionOverlay(QWidget):
 
     def _auto_refresh(self):
         """Auto-refresh callback"""
-        # In real application, this would fetch latest state from live data
-        pass
+        # The owner re-runs predictions with its latest state
+        self.refresh_requested.emit()
 
     def clear_history(self):
         """Clear prediction history"""
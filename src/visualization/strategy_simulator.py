@@ -113,18 +113,25 @@ class StrategySimulator(QWidget):
         self.figure.tight_layout()
         self.canvas.draw()
 
-    def compare_strategies(self, current_state: Dict, max_strategies: int = 5):
-        """Compare multiple strategies"""
+    def compare_strategies(self, current_state: Dict, max_strategies: int = 5, result: Optional[Dict] = None):
+        """
+        Compare multiple strategies
+
+        Args:
+            current_state: Current race state
+            max_strategies: Maximum number of strategies to compare
+            result: Recommendations already computed for this state (skips the recommender)
+        """
         if not ML_AVAILABLE:
             self._plot_demo()
             return
 
         try:
-            if self.recommender is None:
-                self.recommender = StrategyRecommender()
-
             # Get strategy recommendations
-            result = self.recommender.recommend_strategy(current_state, max_strategies=max_strategies)
+            if result is None:
+                if self.recommender is None:
+                    self.recommender = StrategyRecommender()
+                result = self.recommender.recommend_strategy(current_state, max_strategies=max_strategies)
 
             recommended = result.get('recommended_strategy')
             alternatives = result.get('alternative_strategies', [])
@@ -19,20 +19,32 @@ Usage:
     chart.show()
 """
 
+from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox
 from typing import Dict, List, Optional
 
 try:
-    from ..database.repositories import TyreDataRepository, LapDataRepository
-    from ..ml.models import TyreWearModel
+    from ..database.db_manager import db_manager
     DATABASE_AVAILABLE = True
 except ImportError:
     DATABASE_AVAILABLE = False
 
+DRIVER_ITEMS = tuple(f"Driver {i}" for i in range(22))
+
+# Stint artists pre-created per chart (pool grows if a race needs more)
+STINT_POOL_SIZE = 25
+
 
 class TyreWearChart(QWidget):
     """
@@ -54,6 +66,12 @@ class TyreWearChart(QWidget):
         self.driver_index = 0
         self.tyre_model = None
 
+        # Pooled stint artists, shown/hidden and updated in place on refresh
+        self._stint_lines: List[Line2D] = []
+        self._tyre_collections: List[LineCollection] = []
+        self._prediction_artists = []
+        self._history_axes_ready = False
+
         # Compound colors
         self.compound_colors = {
             'SOFT': '#FF0000',      # Red
@@ -63,6 +81,13 @@ class TyreWearChart(QWidget):
             'WET': '#0000FF'        # Blue
         }
 
+        # Pre-parsed RGBA lookup so stint colors skip hex parsing on every plot
+        default_rgba = to_rgba('#888888')
+        self._compound_rgba = defaultdict(
+            lambda: default_rgba,
+            {compound: to_rgba(color) for compound, color in self.compound_colors.items()}
+        )
+
         # Setup UI
         self._setup_ui()
 
@@ -76,9 +101,15 @@ class TyreWearChart(QWidget):
         # Driver selection
         self.driver_label = QLabel("Driver:")
         self.driver_combo = QComboBox()
-        self.driver_combo.addItems([f"Driver {i}" for i in range(22)])
+        self.driver_combo.addItems(DRIVER_ITEMS)
         self.driver_combo.currentIndexChanged.connect(self._on_driver_changed)
 
+        # Debounce driver changes so scrolling through the combo replots once
+        self._driver_timer = QTimer(self)
+        self._driver_timer.setSingleShot(True)
+        self._driver_timer.setInterval(150)
+        self._driver_timer.timeout.connect(self._refresh)
+
         # Refresh button
         self.refresh_btn = QPushButton("Refresh")
         self.refresh_btn.clicked.connect(self._refresh)
@@ -121,98 +152,74 @@ class TyreWearChart(QWidget):
         self.driver_index = driver_index
 
         try:
-            # Load tyre data
-            repo = TyreDataRepository()
-            tyre_data = repo.get_by_session_and_driver(session_id, driver_index)
+            # Load tyre data, already split into stints by the database
+            tyre_data = db_manager.get_tyre_stint_summaries(session_id, driver_index)
 
             if not tyre_data:
                 self._plot_no_data()
                 return
 
-            # Clear axes
-            self.ax.clear()
+            stints = [list(rows) for _, rows in groupby(tyre_data, key=attrgetter('stint_id'))]
 
-            # Group by tyre age (each stint)
-            stints = self._group_into_stints(tyre_data)
+            self._setup_history_axes()
+            self._remove_prediction()
+            if len(stints) > len(self._stint_lines):
+                self._add_stint_artists(len(stints) - len(self._stint_lines))
 
             # Plot each stint
+            max_lap = 0
             for stint_idx, stint in enumerate(stints):
-                laps = [t.tyre_age_laps for t in stint]
-                wear_fl = [t.wear_fl for t in stint]
-                wear_fr = [t.wear_fr for t in stint]
-                wear_rl = [t.wear_rl for t in stint]
-                wear_rr = [t.wear_rr for t in stint]
-
-                # Average wear
-                avg_wear = [(fl + fr + rl + rr) / 4 for fl, fr, rl, rr in zip(wear_fl, wear_fr, wear_rl, wear_rr)]
+                # Wear is plotted as float32 (ample for %), laps fit in int16
+                n = len(stint)
+                laps = np.fromiter((t.tyre_age_laps for t in stint), dtype=np.int16, count=n)
+                wear_fl = np.fromiter((t.wear_fl for t in stint), dtype=np.float32, count=n)
+                wear_fr = np.fromiter((t.wear_fr for t in stint), dtype=np.float32, count=n)
+                wear_rl = np.fromiter((t.wear_rl for t in stint), dtype=np.float32, count=n)
+                wear_rr = np.fromiter((t.wear_rr for t in stint), dtype=np.float32, count=n)
+                avg_wear = np.fromiter((t.avg_wear for t in stint), dtype=np.float32, count=n)
+                max_lap = max(max_lap, int(laps.max()))
 
                 # Compound color
-                compound = stint[0].visual_tyre_compound if stint else 'MEDIUM'
-                color = self.compound_colors.get(compound, '#888888')
-
-                # Plot wear curve
-                self.ax.plot(
-                    laps, avg_wear,
-                    color=color,
-                    linewidth=2,
-                    marker='o',
-                    markersize=4,
-                    label=f'Stint {stint_idx + 1} ({compound})',
-                    alpha=0.8
-                )
+                compound = stint[0].compound or 'MEDIUM'
+                color = self._compound_rgba[compound]
+                label = f'Stint {stint_idx + 1} ({compound})'
+
+                # Individual tyre traces as one segment set per corner
+                segments = [np.column_stack((laps, wear)) for wear in (wear_fl, wear_fr, wear_rl, wear_rr)]
+
+                # Wear curve
+                line = self._stint_lines[stint_idx]
+                line.set_data(laps, avg_wear)
+                line.set_color(color)
+                line.set_label(label)
+                line.set_visible(True)
 
                 # Individual tyre traces (lighter)
-                self.ax.plot(laps, wear_fl, color=color, linestyle='--', alpha=0.3, linewidth=1)
-                self.ax.plot(laps, wear_fr, color=color, linestyle='--', alpha=0.3, linewidth=1)
-                self.ax.plot(laps, wear_rl, color=color, linestyle='--', alpha=0.3, linewidth=1)
-                self.ax.plot(laps, wear_rr, color=color, linestyle='--', alpha=0.3, linewidth=1)
-
-            # Critical thresholds
-            max_lap = max([t.tyre_age_laps for stint in stints for t in stint]) if stints else 50
-            self.ax.axhline(y=80, color='orange', linestyle='--', alpha=0.5, label='80% Wear (Caution)')
-            self.ax.axhline(y=100, color='red', linestyle='--', alpha=0.5, label='100% Wear (Critical)')
-
-            # Styling
-            self.ax.set_xlabel('Tyre Age (Laps)', fontsize=12)
-            self.ax.set_ylabel('Tyre Wear (%)', fontsize=12)
+                tyre_collection = self._tyre_collections[stint_idx]
+                tyre_collection.set_segments(segments)
+                tyre_collection.set_color(color)
+                tyre_collection.set_visible(True)
+
+            # Hide pooled artists not used by this driver
+            for line, tyre_collection in zip(self._stint_lines[len(stints):], self._tyre_collections[len(stints):]):
+                line.set_label('_nolegend_')
+                line.set_visible(False)
+                tyre_collection.set_visible(False)
+
             self.ax.set_title(f'Tyre Wear Evolution - Driver {driver_index}', fontsize=14, fontweight='bold')
             self.ax.set_xlim(0, max_lap + 5)
-            self.ax.set_ylim(0, 120)
-            self.ax.grid(True, alpha=0.3)
             self.ax.legend(loc='upper left', fontsize=9)
 
             # Add prediction if requested
             if show_prediction:
                 self._add_prediction()
 
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
         except Exception as e:
             print(f"Error plotting tyre wear: {e}")
             self._plot_error(str(e))
 
-    def _group_into_stints(self, tyre_data):
-        """Group tyre data into stints"""
-        if not tyre_data:
-            return []
-
-        stints = []
-        current_stint = [tyre_data[0]]
-
-        for i in range(1, len(tyre_data)):
-            # New stint if tyre age resets or compound changes
-            if (tyre_data[i].tyre_age_laps < tyre_data[i - 1].tyre_age_laps or
-                tyre_data[i].visual_tyre_compound != tyre_data[i - 1].visual_tyre_compound):
-                stints.append(current_stint)
-                current_stint = [tyre_data[i]]
-            else:
-                current_stint.append(tyre_data[i])
-
-        if current_stint:
-            stints.append(current_stint)
-
-        return stints
-
     def add_prediction(
         self,
         current_state: Dict,
@@ -250,15 +257,14 @@ class TyreWearChart(QWidget):
             current_wear = current_state.get('avg_wear', 50.0)
 
             # Build forecast points
-            forecast_laps = list(range(current_lap, current_lap + future_laps + 1))
-            forecast_wear = [current_wear]
+            steps = np.arange(future_laps + 1, dtype=np.int16)
+            forecast_laps = steps + np.int16(current_lap)
 
             wear_rate = forecast.get('wear_rate_per_lap', 2.0)
-            for i in range(1, future_laps + 1):
-                forecast_wear.append(current_wear + (wear_rate * i))
+            forecast_wear = np.float32(current_wear) + np.float32(wear_rate) * steps.astype(np.float32)
 
             # Plot prediction
-            self.ax.plot(
+            prediction_line, = self.ax.plot(
                 forecast_laps,
                 forecast_wear,
                 color='purple',
@@ -271,10 +277,10 @@ class TyreWearChart(QWidget):
             )
 
             # Confidence band (±5%)
-            lower_band = [w - 5 for w in forecast_wear]
-            upper_band = [w + 5 for w in forecast_wear]
+            lower_band = forecast_wear - np.float32(5)
+            upper_band = forecast_wear + np.float32(5)
 
-            self.ax.fill_between(
+            confidence_band = self.ax.fill_between(
                 forecast_laps,
                 lower_band,
                 upper_band,
@@ -283,6 +289,8 @@ class TyreWearChart(QWidget):
                 label='Confidence (±5%)'
             )
 
+            self._prediction_artists = [prediction_line, confidence_band]
+
             # Update legend
             self.ax.legend(loc='upper left', fontsize=9)
 
@@ -291,6 +299,56 @@ class TyreWearChart(QWidget):
         except Exception as e:
             print(f"Error adding prediction: {e}")
 
+    def _remove_prediction(self):
+        """Remove prediction overlay artists from the axes"""
+        for artist in self._prediction_artists:
+            artist.remove()
+        self._prediction_artists = []
+
+    def _clear_axes(self):
+        """Clear axes and drop references to persistent artists"""
+        self.ax.clear()
+        self._stint_lines = []
+        self._tyre_collections = []
+        self._prediction_artists = []
+        self._history_axes_ready = False
+
+    def _setup_history_axes(self):
+        """Create thresholds, styling and the stint artist pool once"""
+        if self._history_axes_ready:
+            return
+
+        self._clear_axes()
+
+        # Critical thresholds
+        self.ax.axhline(y=80, color='orange', linestyle='--', alpha=0.5, label='80% Wear (Caution)')
+        self.ax.axhline(y=100, color='red', linestyle='--', alpha=0.5, label='100% Wear (Critical)')
+
+        # Styling
+        self.ax.set_xlabel('Tyre Age (Laps)', fontsize=12)
+        self.ax.set_ylabel('Tyre Wear (%)', fontsize=12)
+        self.ax.set_ylim(0, 120)
+        self.ax.grid(True, alpha=0.3)
+
+        self._add_stint_artists(STINT_POOL_SIZE)
+        self._history_axes_ready = True
+
+    def _add_stint_artists(self, count: int):
+        """Append hidden stint artists (wear curve + tyre traces) to the pool"""
+        for _ in range(count):
+            self._stint_lines.append(self.ax.plot(
+                [], [],
+                linewidth=2,
+                marker='o',
+                markersize=4,
+                alpha=0.8,
+                label='_nolegend_',
+                visible=False
+            )[0])
+            self._tyre_collections.append(self.ax.add_collection(
+                LineCollection([], linestyles='--', alpha=0.3, linewidths=1, visible=False)
+            ))
+
     def _add_prediction(self):
         """Add prediction button handler"""
         if not self.session_id:
@@ -298,8 +356,7 @@ class TyreWearChart(QWidget):
 
         # Get latest tyre state from database
         try:
-            repo = TyreDataRepository()
-            tyre_data = repo.get_by_session_and_driver(self.session_id, self.driver_index)
+            tyre_data = db_manager.get_tyre_stint_summaries(self.session_id, self.driver_index)
 
             if not tyre_data:
                 return
@@ -310,9 +367,9 @@ class TyreWearChart(QWidget):
             current_state = {
                 'lap_number': latest.tyre_age_laps,
                 'tyre_age': latest.tyre_age_laps,
-                'avg_wear': (latest.wear_fl + latest.wear_fr + latest.wear_rl + latest.wear_rr) / 4,
+                'avg_wear': latest.avg_wear,
                 'fuel_remaining': 50.0,  # Default
-                'compound': latest.visual_tyre_compound
+                'compound': latest.compound
             }
 
             self.add_prediction(current_state, future_laps=15)
@@ -328,11 +385,11 @@ class TyreWearChart(QWidget):
     def _on_driver_changed(self, index):
         """Driver selection changed"""
         self.driver_index = index
-        self._refresh()
+        self._driver_timer.start()
 
     def _plot_demo_data(self):
         """Plot demo data when database unavailable"""
-        self.ax.clear()
+        self._clear_axes()
 
         # Demo wear curve
         laps = list(range(0, 30))
@@ -357,7 +414,7 @@ class TyreWearChart(QWidget):
 
     def _plot_no_data(self):
         """Plot when no data available"""
-        self.ax.clear()
+        self._clear_axes()
         self.ax.text(
             0.5, 0.5,
             'No tyre data available for this session',
@@ -369,7 +426,7 @@ class TyreWearChart(QWidget):
 
     def _plot_error(self, error_msg):
         """Plot error message"""
-        self.ax.clear()
+        self._clear_axes()
         self.ax.text(
             0.5, 0.5,
             f'Error loading data:\n{error_msg}',
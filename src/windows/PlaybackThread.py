@@ -7,6 +7,9 @@ import socket
 import time
 import struct
 
+# Recording file layout: [timestamp <d][length <I][payload] per packet
+_HDR = struct.Struct('<dI')
+
 
 class PlaybackThread(QThread):
     """Thread to playback recorded telemetry data"""
@@ -32,14 +35,14 @@ class PlaybackThread(QThread):
         try:
             # Create UDP socket
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            target = (self.host, self.port)
+            self.sock.connect((self.host, self.port))  # Resolve the destination once, not per packet
 
             self.playback_started.emit()
 
             play_count = 0
             while self.running and (self.loop or play_count == 0):
                 play_count += 1
-                packets_sent = self.play_once(target)
+                packets_sent = self.play_once()
 
                 if packets_sent > 0:
                     self.playback_finished.emit(packets_sent)
@@ -61,51 +64,56 @@ class PlaybackThread(QThread):
             if self.sock:
                 self.sock.close()
 
-    def play_once(self, target):
+    def play_once(self):
         """Play the recording once"""
         packets_sent = 0
-        last_timestamp = 0
+        first_timestamp = None
+        start_ns = 0
 
         try:
             with open(self.file_path, 'rb') as f:
                 while self.running:
-                    # Check if paused
-                    while self.paused and self.running:
-                        time.sleep(0.1)
+                    # Check if paused; the pause is added to the schedule so playback resumes in step
+                    if self.paused:
+                        paused_at = time.monotonic_ns()
+                        while self.paused and self.running:
+                            time.sleep(0.1)
+                        start_ns += time.monotonic_ns() - paused_at
 
                     if not self.running:
                         break
 
-                    # Read timestamp (8 bytes double)
-                    timestamp_bytes = f.read(8)
-                    if len(timestamp_bytes) < 8:
+                    # Read timestamp (8 bytes double) and packet length (4 bytes unsigned int)
+                    header = f.read(_HDR.size)
+                    if len(header) < _HDR.size:
                         break  # End of file
 
-                    timestamp = struct.unpack('<d', timestamp_bytes)[0]
-
-                    # Read packet length (4 bytes unsigned int)
-                    length_bytes = f.read(4)
-                    if len(length_bytes) < 4:
-                        break
-
-                    packet_length = struct.unpack('<I', length_bytes)[0]
+                    timestamp, packet_length = _HDR.unpack(header)
 
                     # Read packet data
                     packet_data = f.read(packet_length)
                     if len(packet_data) < packet_length:
                         break
 
-                    # Wait for the appropriate time (adjusted by speed multiplier)
-                    if packets_sent > 0:
-                        delay = (timestamp - last_timestamp) / self.speed
+                    # Wait for the packet's deadline (adjusted by speed multiplier), measured
+                    # on the monotonic clock from the start of playback so sleep overshoot
+                    # never accumulates
+                    if first_timestamp is None:
+                        first_timestamp = timestamp
+                        start_ns = time.monotonic_ns()
+                    else:
+                        deadline_ns = start_ns + int((timestamp - first_timestamp) * 1e9 / self.speed)
+                        delay = (deadline_ns - time.monotonic_ns()) / 1e9
                         if delay > 0:
                             time.sleep(delay)
 
                     # Send the packet
                     if self.running:
-                        self.sock.sendto(packet_data, target)
+                        try:
+                            self.sock.send(packet_data)
+                        except ConnectionRefusedError:
+                            pass  # Nothing listening yet (ICMP port unreachable)
                         packets_sent += 1
-                        last_timestamp = timestamp
 
                         # Emit progress every 50 packets
                         if packets_sent % 50 == 0:
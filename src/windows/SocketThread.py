@@ -1,12 +1,18 @@
+import select
+import socket
+import time
+
 from PySide6.QtCore import QThread, Signal
 
 from src.parsers import parser2025
-from src.parsers.parser2025 import PacketHeader, Packet
 from src.packet_processing.variables import PORT, dictionnary_settings
 
+# Packets are forwarded to the GUI thread in batches, at most this often (s)
+BATCH_INTERVAL = 0.016
+
 
 class SocketThread(QThread):
-    data_received = Signal(PacketHeader, Packet)
+    batch_received = Signal(list)  # [(PacketHeader, Packet), ...]
 
     def __init__(self):
         super().__init__()
@@ -15,14 +21,47 @@ class SocketThread(QThread):
                         redirect=dictionnary_settings["redirect_active"],
                         adress=dictionnary_settings["ip_adress"],
                         redirect_port=int(dictionnary_settings["redirect_port"]))
+        self._new_port = None  # set by change_port(), applied on this thread
+        # Wake-up channel so stop() and change_port() can interrupt a pending select()
+        self._wake_r, self._wake_w = socket.socketpair()
 
     def run(self):
+        batch = []
+        deadline = 0.0
         while self.running:
-            a = self.listener.get()
-            if a is not None:
-                self.data_received.emit(*a)
+            # Sleep until a packet arrives, or until the pending batch is due
+            timeout = max(deadline - time.monotonic(), 0.0) if batch else None
+            ready, _, _ = select.select([self.listener, self._wake_r], [], [], timeout)
+            if self._wake_r in ready:
+                self._wake_r.recv(64)
+                if not self.running:
+                    break
+                if self._new_port is not None:
+                    # Rebind here, so select() never sees the old socket closed under it
+                    self.listener.close()
+                    self.listener.port = self._new_port
+                    self.listener.reset()
+                    self._new_port = None
+                continue
+            if ready:
+                a = self.listener.get()
+                if a is not None:
+                    if not batch:
+                        deadline = time.monotonic() + BATCH_INTERVAL
+                    batch.append(a)
+            if batch and time.monotonic() >= deadline:
+                self.batch_received.emit(batch)
+                batch = []
+
+    def change_port(self, port):
+        """Make the listener receive on another port (called from the GUI thread)"""
+        self._new_port = port
+        self._wake_w.send(b'p')
 
     def stop(self):
         self.running = False
+        self._wake_w.send(b'x')
         self.quit()
-        self.wait()
\ No newline at end of file
+        self.wait()
+        self._wake_r.close()
+        self._wake_w.close()
@@ -0,0 +1,28 @@
+"""
+Task Worker - Runs long database/ML jobs (export, import, training) off the GUI thread
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+
+class TaskWorker(QObject):
+    """Runs a task on a worker QThread and reports back through signals"""
+
+    progress = Signal(int)  # completed steps
+    finished = Signal(object)  # task result
+    error = Signal(str, str)  # title, message
+
+    def __init__(self, task, error_title, error_message):
+        super().__init__()
+        self.task = task
+        self.error_title = error_title
+        self.error_message = error_message
+
+    def run(self):
+        """Run the task, passing it a callback to report completed steps"""
+        try:
+            result = self.task(self.progress.emit)
+        except Exception as e:
+            self.error.emit(self.error_title, f"{self.error_message}:\n\n{str(e)}")
+        else:
+            self.finished.emit(result)
@@ -1,11 +1,20 @@
-from PySide6.QtCore import QSize, QAbstractTableModel
+import logging
+import time
+from functools import lru_cache, partial
+
+import numpy as np
+
+from PySide6.QtCore import QSize, QAbstractTableModel, QTimer, QThreadPool, QThread, QEvent
 from PySide6.QtGui import QFont, Qt, QAction
 from PySide6.QtWidgets import (
     QMainWindow, QTableView, QVBoxLayout, QWidget, QTabWidget, QHBoxLayout, QLabel, QAbstractItemView,
-    QTabBar, QStackedWidget, QSizePolicy, QMessageBox, QFileDialog, QInputDialog, QListWidget
+    QTabBar, QStackedWidget, QSizePolicy, QMessageBox, QFileDialog, QInputDialog, QListWidget, QProgressDialog
 )
 
-from src.packet_processing.packet_management import *
+from src.packet_processing.packet_management import (
+    update_motion, update_session, update_lap_data, update_event, update_participants, update_car_setups,
+    update_car_telemetry, update_car_status, update_car_damage, update_motion_extended
+)
 from src.table_models.DamageTableModel import DamageTableModel
 from src.table_models.ERSAndFuelTableMable import ERSAndFuelTableModel
 from src.table_models.LapTableModel import LapTableModel
@@ -18,9 +27,14 @@ from src.table_models.RaceDirection import RaceDirection
 
 from src.table_models.Canvas import Canvas
 from src.windows.SocketThread import SocketThread
+from src.windows.port_selection_window import PortSelectionWindow
+from src.windows.UDP_redirect_window import UDPRedirectWindow
+from src.windows.TaskWorker import TaskWorker
 from src.packet_processing.variables import PLAYERS_LIST, COLUMN_SIZE_DICTIONARY, session
 import src
 
+log = logging.getLogger(__name__)
+
 # Database integration for export/import UI
 try:
     from src.database import get_statistics, db_manager
@@ -38,38 +52,80 @@ try:
     ADVANCED_WINDOWS_AVAILABLE = True
 except ImportError:
     ADVANCED_WINDOWS_AVAILABLE = False
-    print("[UI] Advanced windows not available - some features disabled")
+    log.warning("Advanced windows not available - some features disabled")
+
+# Session pickers share one cached query, refreshed at most every few seconds
+RECENT_SESSIONS_LIMIT = 100
+RECENT_SESSIONS_TTL = 5
+
+
+@lru_cache(maxsize=1)
+def _fetch_recent_sessions(bucket):
+    return db_manager.get_recent_sessions(limit=RECENT_SESSIONS_LIMIT)
+
+
+def get_recent_sessions(limit=10):
+    """Most recent sessions (newest first), cached for RECENT_SESSIONS_TTL seconds"""
+    return _fetch_recent_sessions(int(time.monotonic() // RECENT_SESSIONS_TTL))[:limit]
+
+
+@lru_cache(maxsize=256)
+def _format_session(session_id, track_name, session_type, created_at):
+    return f"Session {session_id}: {track_name} - {session_type} ({created_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+def format_session_choices(sessions):
+    """Picker labels for sessions, with the parallel list of session ids"""
+    session_items = [_format_session(s.id, s.track_name, s.session_type, s.created_at) for s in sessions]
+    session_ids = [s.id for s in sessions]
+    return session_items, session_ids
+
+
+def prime_recent_sessions():
+    """Warm the session cache on a pool thread so pickers open instantly"""
+    QThreadPool.globalInstance().start(get_recent_sessions)
 
 
 class FixedSizeTabBar(QTabBar):
+    TAB_WIDTHS = (90, 110, 90, 180, 140, 70, 220, 200, 200)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sizes = None
+
     def tabSizeHint(self, index):
-        default_size = super().tabSizeHint(index)
-        custom_widths = {
-            0: 90,
-            1: 110,
-            2: 90,
-            3: 180,
-            4: 140,
-            5: 70,
-            6: 220,
-            7: 200,
-            8: 200
-        }
-        width = custom_widths.get(index, default_size.width())
-        return QSize(width, default_size.height())
+        if index >= len(self.TAB_WIDTHS):
+            return super().tabSizeHint(index)
+        if self._sizes is None:
+            # Tab height comes from the style; query it once and reuse the sizes
+            height = super().tabSizeHint(index).height()
+            self._sizes = tuple(QSize(width, height) for width in self.TAB_WIDTHS)
+        return self._sizes[index]
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._sizes = None
+        super().changeEvent(event)
 
 class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Telemetry Application")
+
+        # Redraw the map once the user stops resizing, not on every step
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._on_resize_finished)
+
         self.resize(1080, 720)
 
         # Create menu bar with export/database controls
         self.create_menu_bar()
 
         self.socketThread = SocketThread()
-        self.socketThread.data_received.connect(self.update_table)
+        self.socketThread.batch_received.connect(self.update_table)
         self.socketThread.start()
 
         self.main_layout = QVBoxLayout()
@@ -77,6 +133,10 @@ class MainWindow(QMainWindow):
         self.index = 0
 
         self.menu = QListWidget()
+        # Single-line rows sharing one font: skip per-row size computation
+        self.menu.setUniformItemSizes(True)
+        self.menu.setAutoScroll(False)
+        self.menu.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
 
         # Original menu items
         menu_items = ["Main", "Damage", "Laps", "Temperatures", "Map", "ERS & Fuel",
@@ -111,68 +171,85 @@ class MainWindow(QMainWindow):
             self.raceDirectorModel
         ]
 
-        # Initialize advanced windows if available
+        # Advanced windows are heavy: reserve their slots with placeholders
+        # and build each one on first selection (see on_row_changed)
+        self._advanced_specs = {}
         if ADVANCED_WINDOWS_AVAILABLE:
-            try:
-                print("[UI] Loading Analytics window...")
-                self.analytics_window = AnalyticsWindow()
-                print("[UI] Loading Predictions window...")
-                self.prediction_window = PredictionWindow()
-                print("[UI] Loading Strategy window...")
-                self.strategy_window = StrategyWindow()
-
-                # Add to models list
-                self.models.extend([
-                    self.analytics_window,
-                    self.prediction_window,
-                    self.strategy_window
-                ])
-
-                print("[UI] ✓ Advanced windows loaded successfully")
-            except Exception as e:
-                print(f"[UI] Warning: Failed to load advanced windows: {e}")
-                # Note: Advanced windows failed to load but app continues with original features
+            advanced_windows = [
+                ('analytics_window', AnalyticsWindow),
+                ('prediction_window', PredictionWindow),
+                ('strategy_window', StrategyWindow)
+            ]
+            for index, spec in enumerate(advanced_windows, start=len(self.models)):
+                self._advanced_specs[index] = spec
+                self.models.append(QWidget())
 
         self.stack = QStackedWidget()
         self.menu.currentRowChanged.connect(self.on_row_changed)
+        self._current_model = self.models[self.index]
 
         self.title_label = QLabel()
 
         self.create_layout()
 
-        self.packet_reception_dict = [0 for _ in range(16)]
-        self.last_update = 0
+        # Long-running export/import/ML jobs: QThread -> TaskWorker
+        self._background_tasks = {}
+
+        self.packet_reception_dict = np.zeros(16, dtype=np.uint32)
+        self.last_update = time.monotonic()
+
+        # Repaint the visible model at ~30 Hz instead of on every packet
+        self._model_dirty = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(33)
+        self._refresh_timer.timeout.connect(self._refresh_current_model)
+        self._refresh_timer.start()
 
         container = QWidget()
         container.setLayout(self.main_layout)
         self.setCentralWidget(container)
 
 
-        MainWindow.function_hashmap = [  # PacketId : (fonction, arguments)
-            lambda packet : update_motion(packet),                                   # 0 : PacketMotion
-            lambda packet : update_session(packet),                                  # 1 : PacketSession
-            lambda packet : update_lap_data(packet),                                 # 2 : PacketLapData
-            lambda packet : update_event(packet, self.raceDirectorModel),            # 3 : PacketEvent
-            lambda packet : update_participants(packet),                             # 4 : PacketParticipants
-            lambda packet : update_car_setups(packet),                               # 5 : PacketCarSetup
-            lambda packet : update_car_telemetry(packet),                            # 6 : PacketCarTelemetry
-            lambda packet : update_car_status(packet),                               # 7 : PacketCarStatus
-            lambda packet : None,                                                    # 8 : PacketFinalClassification
-            lambda packet : None,                                                    # 9 : PacketLobbyInfo
-            lambda packet : update_car_damage(packet),                               # 10 : PacketCarDamage
-            lambda packet : None,                                                    # 11 : PacketSessionHistory
-            lambda packet : None,                                                    # 12 : PacketTyreSetsData
-            lambda packet : update_motion_extended(packet),                          # 13 : PacketMotionExData
-            lambda packet : None,                                                    # 14 : PacketTimeTrialData
-            lambda packet : None                                                     # 15 : PacketLapPositions
-        ]
+        self._dispatch = (  # PacketId : handler (None = ignored)
+            update_motion,                                         # 0 : PacketMotion
+            update_session,                                        # 1 : PacketSession
+            update_lap_data,                                       # 2 : PacketLapData
+            partial(update_event, qlist=self.raceDirectorModel),   # 3 : PacketEvent
+            update_participants,                                   # 4 : PacketParticipants
+            update_car_setups,                                     # 5 : PacketCarSetup
+            update_car_telemetry,                                  # 6 : PacketCarTelemetry
+            update_car_status,                                     # 7 : PacketCarStatus
+            None,                                                  # 8 : PacketFinalClassification
+            None,                                                  # 9 : PacketLobbyInfo
+            update_car_damage,                                     # 10 : PacketCarDamage
+            None,                                                  # 11 : PacketSessionHistory
+            None,                                                  # 12 : PacketTyreSetsData
+            update_motion_extended,                                # 13 : PacketMotionExData
+            None,                                                  # 14 : PacketTimeTrialData
+            None                                                   # 15 : PacketLapPositions
+        )
 
     def create_menu_bar(self):
-        """Create menu bar with Export and Database menus"""
+        """Create menu bar with Settings, Export and Database menus"""
         menubar = self.menuBar()
 
+        # Settings Menu
+        settings_menu = menubar.addMenu("Settings")
+
+        port_action = QAction("Receiving Port...", self)
+        port_action.setStatusTip("Change the UDP port telemetry is received on")
+        port_action.triggered.connect(self.show_port_selection)
+        settings_menu.addAction(port_action)
+
+        redirect_action = QAction("UDP Redirect...", self)
+        redirect_action.setStatusTip("Forward received telemetry to another address")
+        redirect_action.triggered.connect(self.show_udp_redirect)
+        settings_menu.addAction(redirect_action)
+
         # Export Menu
         export_menu = menubar.addMenu("Export")
+        if DATABASE_UI_ENABLED:
+            export_menu.aboutToShow.connect(prime_recent_sessions)
 
         if DATABASE_UI_ENABLED:
             # Export to CSV
@@ -202,6 +279,8 @@ class MainWindow(QMainWindow):
 
         # Database Menu
         database_menu = menubar.addMenu("Database")
+        if DATABASE_UI_ENABLED:
+            database_menu.aboutToShow.connect(prime_recent_sessions)
 
         if DATABASE_UI_ENABLED:
             # View Statistics
@@ -226,6 +305,8 @@ class MainWindow(QMainWindow):
         # Advanced Features Menu (Phase 5)
         if ADVANCED_WINDOWS_AVAILABLE:
             advanced_menu = menubar.addMenu("Advanced")
+            if DATABASE_UI_ENABLED:
+                advanced_menu.aboutToShow.connect(prime_recent_sessions)
 
             # Anomaly Detection
             anomaly_action = QAction("Detect Anomalies...", self)
@@ -247,6 +328,14 @@ class MainWindow(QMainWindow):
             alerts_action.triggered.connect(self.show_strategy_alerts)
             advanced_menu.addAction(alerts_action)
 
+    def show_port_selection(self):
+        """Open the receiving port dialog"""
+        PortSelectionWindow(self.socketThread, self).exec()
+
+    def show_udp_redirect(self):
+        """Open the UDP redirect dialog"""
+        UDPRedirectWindow(self.socketThread.listener, self).exec()
+
     def closeEvent(self, event):
         self.socketThread.stop()
         self.close()
@@ -271,12 +360,9 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.packetReceptionTableModel.table)
         self.stack.addWidget(self.raceDirectorModel)
 
-        # Add advanced windows if available
-        if ADVANCED_WINDOWS_AVAILABLE:
-            self.stack.addWidget(self.analytics_window)
-            self.stack.addWidget(self.prediction_window)
-            self.stack.addWidget(self.strategy_window)
-            print("[UI] ✓ Advanced windows added to stack")
+        # Placeholders for the lazily built advanced windows
+        for index in self._advanced_specs:
+            self.stack.addWidget(self.models[index])
 
         h_layout1.addWidget(self.title_label)
         h_layout2.addWidget(self.menu)
@@ -285,28 +371,125 @@ class MainWindow(QMainWindow):
         self.main_layout.addLayout(h_layout1)
         self.main_layout.addLayout(h_layout2)
 
-    def update_table(self, header, packet):
-        MainWindow.function_hashmap[header.m_packet_id](packet)
+    def update_table(self, batch):
+        # Count the whole batch in one scatter-add
+        packet_ids = np.fromiter((header.m_packet_id for header, _ in batch), dtype=np.uint8, count=len(batch))
+        np.add.at(self.packet_reception_dict, packet_ids, 1)
+
+        # Hot loop: bind attributes to locals once per batch
+        dispatch = self._dispatch
+        session_updated = False
+        for packet_id, (_, packet) in zip(packet_ids.tolist(), batch):
+            handler = dispatch[packet_id]
+            if handler is not None:
+                handler(packet)
 
-        self.models[self.index].update()
+            if packet_id == 1:
+                session_updated = True
 
-        if header.m_packet_id == 1:
+        self._model_dirty = True
+
+        if session_updated:
             self.title_label.setText(session.title_display())
 
-        self.packet_reception_dict[header.m_packet_id] += 1
-        if time.time() > self.last_update + 1:
+        now = time.monotonic()
+        if now - self.last_update >= 1.0:
             self.packetReceptionTableModel.update_each_second()
-            self.packet_reception_dict = [0 for _ in range(16)]
-            self.last_update = time.time()
+            self.packet_reception_dict[:] = 0
+            self.last_update = now
 
     def on_row_changed(self, index):
+        if index in self._advanced_specs:
+            self._build_advanced_window(index)
         self.stack.setCurrentIndex(index)
         self.index = index
+        self._current_model = self.models[index]
+        self._model_dirty = True
+
+    def _build_advanced_window(self, index):
+        attr, window_cls = self._advanced_specs.pop(index)
+        try:
+            log.debug("Loading %s...", window_cls.__name__)
+            window = window_cls()
+        except Exception as e:
+            log.warning("Failed to load %s: %s", window_cls.__name__, e)
+            return
+
+        placeholder = self.models[index]
+        self.stack.removeWidget(placeholder)
+        self.stack.insertWidget(index, window)
+        placeholder.deleteLater()
+
+        setattr(self, attr, window)
+        self.models[index] = window
+
+    def _refresh_current_model(self):
+        # Nothing to paint while minimized or hidden; stay dirty until shown again
+        if not self._model_dirty or self.isMinimized() or not self.isVisible():
+            return
+        self._model_dirty = False
+        self._current_model.update()
 
     def resizeEvent(self, event):
-        src.packet_processing.variables.REDRAW_MAP = True
         super().resizeEvent(event)
-        self.models[self.index].update()
+        self._resize_timer.start()
+
+    def _on_resize_finished(self):
+        src.packet_processing.variables.REDRAW_MAP = True
+        self._current_model.update()
+
+    # Background tasks
+    def run_in_background(self, label, task, on_finished, error_title, error_message, steps=0):
+        """
+        Run a long task on a worker thread behind a modeless progress dialog
+
+        Args:
+            label: Progress dialog text
+            task: Callable taking a report_progress(int) callback; runs off the GUI thread
+            on_finished: Slot receiving the task's return value on the GUI thread
+            error_title: Title of the error box shown if the task raises
+            error_message: Error box text, followed by the exception message
+            steps: Number of progress steps, or 0 for a busy indicator
+        """
+        progress = QProgressDialog(self)
+        progress.setWindowTitle("Please wait")
+        progress.setLabelText(label)
+        progress.setCancelButton(None)
+        progress.setRange(0, steps)
+        progress.setMinimumDuration(0)
+        progress.setModal(False)
+        progress.show()
+
+        thread = QThread(self)
+        worker = TaskWorker(task, error_title, error_message)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(on_finished)
+        worker.error.connect(self.show_task_error)
+        for signal in (worker.finished, worker.error):
+            signal.connect(progress.close)
+            signal.connect(thread.quit)
+        thread.finished.connect(self._on_background_task_finished)
+
+        self._background_tasks[thread] = worker
+        thread.start()
+
+    def _on_background_task_finished(self):
+        thread = self.sender()
+        worker = self._background_tasks.pop(thread, None)
+        if worker is not None:
+            worker.deleteLater()
+        thread.deleteLater()
+
+    def show_task_result(self, result):
+        """Show a (title, message) result returned by a background task"""
+        title, message = result
+        QMessageBox.information(self, title, message)
+
+    def show_task_error(self, title, message):
+        QMessageBox.critical(self, title, message)
 
     # Database Export/Import UI Handlers
     def export_to_csv(self):
@@ -314,84 +497,67 @@ class MainWindow(QMainWindow):
         if not DATABASE_UI_ENABLED:
             return
 
-        try:
-            # Get recent sessions
-            sessions = db_manager.get_recent_sessions(limit=10)
-            if not sessions:
-                QMessageBox.information(self, "No Data", "No sessions found in database.\n\nRun a session first to record data.")
-                return
-
-            # Let user select session
-            session_items = [f"Session {s.id}: {s.track_name} - {s.session_type} ({s.created_at.strftime('%Y-%m-%d %H:%M')})"
-                           for s in sessions]
-            session_text, ok = QInputDialog.getItem(
-                self, "Select Session", "Choose session to export:", session_items, 0, False
-            )
-            if not ok:
-                return
-
-            session_id = int(session_text.split(":")[0].split()[ 1])
-
-            # Choose output directory
-            output_dir = QFileDialog.getExistingDirectory(
-                self, "Select Export Directory", "exports"
-            )
-            if not output_dir:
-                return
-
-            # Export
-            QMessageBox.information(self, "Exporting...", "Exporting session to CSV...\n\nThis may take a moment.")
-            exporter = CSVExporter()
-            exporter.export_session(session_id=session_id, output_dir=output_dir, include_telemetry=True)
-
-            QMessageBox.information(
-                self, "Export Complete",
-                f"Session exported successfully!\n\nLocation: {output_dir}/\n\nFiles created:\n"
-                f"- Laps CSV\n- Tyres CSV\n- Damage CSV\n- Telemetry CSV\n- Weather CSV"
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export session:\n\n{str(e)}")
+        self._export_session(
+            CSVExporter, "exports", "CSV", {'include_telemetry': True},
+            "Files created:\n- Laps CSV\n- Tyres CSV\n- Damage CSV\n- Telemetry CSV\n- Weather CSV"
+        )
 
     def export_to_parquet(self):
         """Export current session to Parquet files (ML-optimized)"""
         if not DATABASE_UI_ENABLED:
             return
 
+        self._export_session(
+            ParquetExporter, "ml_data", "Parquet", {'compression': 'snappy'},
+            "Format: Parquet (5-10x smaller than CSV)\nCompression: Snappy\n\nReady for ML training!"
+        )
+
+    def _export_session(self, exporter_cls, default_dir, format_label, export_kwargs, details):
+        """
+        Pick a recent session and an output directory, then export it in the background
+
+        Args:
+            exporter_cls: CSVExporter or ParquetExporter
+            default_dir: Directory initially shown in the directory chooser
+            format_label: Format name shown in the progress dialog
+            export_kwargs: Extra keyword arguments for export_session()
+            details: Format-specific text appended to the completion message
+        """
         try:
             # Get recent sessions
-            sessions = db_manager.get_recent_sessions(limit=10)
+            sessions = get_recent_sessions(limit=10)
             if not sessions:
                 QMessageBox.information(self, "No Data", "No sessions found in database.\n\nRun a session first to record data.")
                 return
 
             # Let user select session
-            session_items = [f"Session {s.id}: {s.track_name} - {s.session_type} ({s.created_at.strftime('%Y-%m-%d %H:%M')})"
-                           for s in sessions]
+            session_items, session_ids = format_session_choices(sessions)
             session_text, ok = QInputDialog.getItem(
                 self, "Select Session", "Choose session to export:", session_items, 0, False
             )
             if not ok:
                 return
 
-            session_id = int(session_text.split(":")[0].split()[1])
+            session_id = session_ids[session_items.index(session_text)]
 
             # Choose output directory
             output_dir = QFileDialog.getExistingDirectory(
-                self, "Select Export Directory", "ml_data"
+                self, "Select Export Directory", default_dir
             )
             if not output_dir:
                 return
 
             # Export
-            QMessageBox.information(self, "Exporting...", "Exporting session to Parquet...\n\nThis may take a moment.")
-            exporter = ParquetExporter()
-            exporter.export_session(session_id=session_id, output_dir=output_dir, compression='snappy')
-
-            QMessageBox.information(
-                self, "Export Complete",
-                f"Session exported successfully!\n\nLocation: {output_dir}/\n\n"
-                f"Format: Parquet (5-10x smaller than CSV)\n"
-                f"Compression: Snappy\n\nReady for ML training!"
+            def export(report_progress):
+                exporter_cls().export_session(session_id=session_id, output_dir=output_dir, **export_kwargs)
+                return (
+                    "Export Complete",
+                    f"Session exported successfully!\n\nLocation: {output_dir}/\n\n{details}"
+                )
+
+            self.run_in_background(
+                f"Exporting session to {format_label}...", export, self.show_task_result,
+                "Export Error", "Failed to export session"
             )
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export session:\n\n{str(e)}")
@@ -424,18 +590,22 @@ class MainWindow(QMainWindow):
                 return
 
             # Import
-            QMessageBox.information(self, "Importing...", "Importing CSV data...\n\nThis may take a moment.")
-            importer = CSVImporter()
-            session_id = importer.import_lap_csv(
-                csv_path=csv_file,
-                track_name=track_name,
-                session_type=session_type
-            )
-
-            QMessageBox.information(
-                self, "Import Complete",
-                f"CSV imported successfully!\n\nSession ID: {session_id}\n"
-                f"Imported {importer.imported_records} records"
+            def import_data(report_progress):
+                importer = CSVImporter()
+                session_id = importer.import_lap_csv(
+                    csv_path=csv_file,
+                    track_name=track_name,
+                    session_type=session_type
+                )
+                return (
+                    "Import Complete",
+                    f"CSV imported successfully!\n\nSession ID: {session_id}\n"
+                    f"Imported {importer.imported_records} records"
+                )
+
+            self.run_in_background(
+                "Importing CSV data...", import_data, self.show_task_result,
+                "Import Error", "Failed to import CSV"
             )
         except Exception as e:
             QMessageBox.critical(self, "Import Error", f"Failed to import CSV:\n\n{str(e)}")
@@ -469,7 +639,7 @@ class MainWindow(QMainWindow):
 
         try:
             # Get all sessions
-            sessions = db_manager.get_recent_sessions(limit=100)
+            sessions = get_recent_sessions(limit=100)
             if not sessions:
                 QMessageBox.information(self, "No Data", "No sessions found in database.")
                 return
@@ -490,23 +660,26 @@ class MainWindow(QMainWindow):
                 return
 
             # Export all sessions
-            QMessageBox.information(
-                self, "Exporting...",
-                f"Exporting {len(sessions)} sessions...\n\nThis may take several minutes."
-            )
-
-            if "CSV" in format_choice:
-                exporter = CSVExporter()
-                for s in sessions:
-                    exporter.export_session(session_id=s.id, output_dir=output_dir, include_telemetry=False)
-            else:
-                exporter = ParquetExporter()
-                session_ids = [s.id for s in sessions]
-                exporter.export_for_ml_training(session_ids=session_ids, output_dir=output_dir)
-
-            QMessageBox.information(
-                self, "Export Complete",
-                f"All {len(sessions)} sessions exported successfully!\n\nLocation: {output_dir}/"
+            session_ids = [s.id for s in sessions]
+            export_csv = "CSV" in format_choice
+
+            def export(report_progress):
+                if export_csv:
+                    exporter = CSVExporter()
+                    exporter.export_many(session_ids, output_dir, include_telemetry=False,
+                                         report_progress=report_progress)
+                else:
+                    exporter = ParquetExporter()
+                    exporter.export_for_ml_training(session_ids=session_ids, output_dir=output_dir)
+                return (
+                    "Export Complete",
+                    f"All {len(session_ids)} sessions exported successfully!\n\nLocation: {output_dir}/"
+                )
+
+            self.run_in_background(
+                f"Exporting {len(session_ids)} sessions...", export, self.show_task_result,
+                "Export Error", "Failed to export sessions",
+                steps=len(session_ids) if export_csv else 0
             )
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export sessions:\n\n{str(e)}")
@@ -521,45 +694,50 @@ class MainWindow(QMainWindow):
             from src.advanced import AnomalyDetector
 
             # Get session ID
-            sessions = db_manager.get_recent_sessions(limit=10)
+            sessions = get_recent_sessions(limit=10)
             if not sessions:
                 QMessageBox.information(self, "No Data", "No sessions found in database.")
                 return
 
-            session_items = [f"Session {s.id}: {s.track_name} - {s.session_type}" for s in sessions]
+            session_items, session_ids = format_session_choices(sessions)
             session_text, ok = QInputDialog.getItem(
                 self, "Select Session", "Choose session for anomaly detection:", session_items, 0, False
             )
             if not ok:
                 return
 
-            session_id = int(session_text.split(":")[0].split()[1])
+            session_id = session_ids[session_items.index(session_text)]
 
             # Run detection
-            QMessageBox.information(self, "Detecting...", "Running anomaly detection...\n\nThis may take a moment.")
-
-            detector = AnomalyDetector()
-            anomalies = detector.detect_all_anomalies(session_id, driver_index=0)
-            report = detector.generate_report(anomalies)
+            def detect(report_progress):
+                detector = AnomalyDetector()
+                anomalies = detector.detect_all_anomalies(session_id, driver_index=0)
+                return detector.generate_report(anomalies)
+
+            self.run_in_background(
+                "Running anomaly detection...", detect, self.show_anomaly_report,
+                "Error", "Anomaly detection failed"
+            )
 
-            # Show report
-            from PySide6.QtWidgets import QTextEdit, QDialog, QVBoxLayout
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Anomaly Detection Report")
-            dialog.resize(700, 600)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Anomaly detection failed:\n\n{str(e)}")
 
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setPlainText(report)
-            text_edit.setFont(QFont("Courier", 10))
+    def show_anomaly_report(self, report):
+        """Show an anomaly detection report"""
+        from PySide6.QtWidgets import QTextEdit, QDialog, QVBoxLayout
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Anomaly Detection Report")
+        dialog.resize(700, 600)
 
-            layout = QVBoxLayout()
-            layout.addWidget(text_edit)
-            dialog.setLayout(layout)
-            dialog.exec()
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.setPlainText(report)
+        text_edit.setFont(QFont("Courier", 10))
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Anomaly detection failed:\n\n{str(e)}")
+        layout = QVBoxLayout()
+        layout.addWidget(text_edit)
+        dialog.setLayout(layout)
+        dialog.exec()
 
     def train_track_model(self):
         """Train track-specific model"""
@@ -577,7 +755,7 @@ class MainWindow(QMainWindow):
                 return
 
             # Get sessions
-            sessions = db_manager.get_recent_sessions(limit=20)
+            sessions = get_recent_sessions(limit=20)
             session_ids = [s.id for s in sessions]
 
             if not session_ids:
@@ -585,25 +763,25 @@ class MainWindow(QMainWindow):
                 return
 
             # Train
-            QMessageBox.information(
-                self, "Training...",
-                f"Training {track_name} model on {len(session_ids)} sessions...\n\nThis may take a moment."
-            )
-
-            learner = MultiSessionLearning()
-            result = learner.train_track_specific_model(
-                track_name=track_name,
-                session_ids=session_ids,
-                model_type='tyre_wear'
-            )
-
-            QMessageBox.information(
-                self, "Training Complete",
-                f"Track model trained successfully!\n\n"
-                f"Track: {result['track']}\n"
-                f"Samples: {result['samples']}\n"
-                f"Test R²: {result['test_r2']:.3f}\n"
-                f"Model saved to: {result['model_path']}"
+            def train(report_progress):
+                learner = MultiSessionLearning()
+                result = learner.train_track_specific_model(
+                    track_name=track_name,
+                    session_ids=session_ids,
+                    model_type='tyre_wear'
+                )
+                return (
+                    "Training Complete",
+                    f"Track model trained successfully!\n\n"
+                    f"Track: {result['track']}\n"
+                    f"Samples: {result['samples']}\n"
+                    f"Test R²: {result['test_r2']:.3f}\n"
+                    f"Model saved to: {result['model_path']}"
+                )
+
+            self.run_in_background(
+                f"Training {track_name} model on {len(session_ids)} sessions...", train, self.show_task_result,
+                "Error", "Training failed"
             )
 
         except Exception as e:
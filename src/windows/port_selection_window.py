@@ -1,39 +1,55 @@
-from ttkbootstrap import Toplevel, Entry, Label
-from tkinter import Message, Button
-from src.packet_processing.variables import *
+from PySide6.QtCore import QRunnable, QThreadPool
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QSpinBox, QPushButton
+from src.packet_processing.variables import PORT, dictionnary_settings, settings_path
 
 import json
+import os
 
 
-class PortSelectionWindow(Toplevel):
-    def __init__(self):
+class SaveSettingsTask(QRunnable):
+    """Atomically writes a settings snapshot to settings.txt on a pool thread"""
+
+    def __init__(self, settings):
         super().__init__()
-        self.grab_set()
-        self.wm_title("Port Selection")
-        Label(self, text="Receiving PORT :", font=("Arial", 16)).grid(row=0, column=0, sticky="we", padx=30)
+        self.settings = settings
+
+    def run(self):
+        tmp_path = settings_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.settings))
+        os.replace(tmp_path, settings_path)
+
+
+class PortSelectionWindow(QDialog):
+    def __init__(self, socket_thread, parent=None):
+        super().__init__(parent)
+        self.socket_thread = socket_thread
+        self.setWindowTitle("Port Selection")
+        self.setModal(True)
+        self.setFont(QFont("Arial", 16))
+
+        label = QLabel("Receiving PORT :")
 
-        self.entry = Entry(self, font=("Arial", 16))
-        self.entry.insert(0, dictionnary_settings["port"])
-        self.entry.grid(row=1, column=0, padx=30)
+        # The spin box only accepts valid ports, so no manual validation is needed
+        self.port_spin = QSpinBox()
+        self.port_spin.setRange(1000, 65535)
+        self.port_spin.setValue(int(dictionnary_settings["port"]))
 
-        self.bind('<Return>', lambda e: self.button())
-        self.bind('<KP_Enter>', lambda e: self.button())
-        b = Button(self, text="Confirm", font=("Arial", 16), command=self.button)
-        b.grid(row=2, column=0, pady=10)
+        confirm_button = QPushButton("Confirm")
+        confirm_button.setDefault(True)
+        confirm_button.clicked.connect(self.button)
 
+        layout = QVBoxLayout()
+        layout.setContentsMargins(30, 10, 30, 10)
+        layout.addWidget(label)
+        layout.addWidget(self.port_spin)
+        layout.addWidget(confirm_button)
+        self.setLayout(layout)
 
     def button(self):
-        PORT[0] = self.entry.get()
-        if not PORT[0].isdigit() or not 1000 <= int(PORT[0]) <= 65536:
-            Message(self, text="The PORT must be an integer between 1000 and 65536", fg="red",
-                    font=("Arial", 16)).grid(
-                row=3, column=0)
-        else:
-            listener.socket.close()
-            listener.port = int(PORT[0])
-            listener.reset()
-            Label(self, text="").grid(row=3, column=0)
-            dictionnary_settings["port"] = str(PORT[0])
-            with open("../../settings.txt", "w") as f:
-                json.dump(dictionnary_settings, f)
-            self.destroy()
\ No newline at end of file
+        port = self.port_spin.value()
+        PORT[0] = port
+        self.socket_thread.change_port(port)
+        dictionnary_settings["port"] = str(port)
+        QThreadPool.globalInstance().start(SaveSettingsTask(dict(dictionnary_settings)))
+        self.accept()
@@ -21,17 +21,51 @@ Usage:
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QPushButton, QLabel, QTextEdit, QFileDialog, QCheckBox
+    QPushButton, QLabel, QPlainTextEdit, QFileDialog, QCheckBox
 )
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from pathlib import Path
 from PySide6.QtCore import Qt, QTimer
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-try:
-    from ..visualization import PredictionOverlay
+if TYPE_CHECKING:
     from ..ml.inference import RealTimePredictor
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
+
+# ML components are imported on first use so opening the app doesn't pull in sklearn/xgboost
+_ML_STATE: Dict = {}
+
+
+def _ensure_ml() -> bool:
+    """Import the ML components once and report whether they are available"""
+    if 'available' not in _ML_STATE:
+        try:
+            from ..visualization import PredictionOverlay
+            from ..ml.inference import RealTimePredictor
+        except ImportError:
+            _ML_STATE['available'] = False
+        else:
+            _ML_STATE.update(available=True, PredictionOverlay=PredictionOverlay, RealTimePredictor=RealTimePredictor)
+    return _ML_STATE['available']
+
+# Recent predictions kept per window, keyed on the coarse race state
+PREDICTION_CACHE_SIZE = 128
+
+# Oldest log lines are dropped past this many
+LOG_MAX_LINES = 500
+
+# Simulated state used by "Update Now" (read-only, shared across clicks)
+DEMO_STATE = MappingProxyType({
+    'current_lap': 25,
+    'current_position': 5,
+    'tyre_age': 15,
+    'avg_wear': 52.0,
+    'total_laps': 50,
+    'current_lap_time': 87000,
+    'base_lap_time': 85000,
+    'fuel_remaining': 35.0
+})
 
 
 class PredictionWindow(QWidget):
@@ -41,10 +75,23 @@ class PredictionWindow(QWidget):
     Real-time predictions with visualization.
     """
 
+    # Loaded predictors shared across windows, keyed on (models_dir, newest file mtime)
+    _predictor_cache: Dict[tuple, 'RealTimePredictor'] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.predictor: Optional['RealTimePredictor'] = None
+        self._pred_cache: OrderedDict = OrderedDict()
+
+        # Latest state, and the coarse inputs it was last predicted for
+        self._latest_state: Optional[Dict] = None
+        self._last_state_hash = None
+
+        # Models directory picker, reused so it remembers the last folder
+        self._models_dlg = QFileDialog(self, "Select Models Directory", "models")
+        self._models_dlg.setFileMode(QFileDialog.Directory)
+        self._models_dlg.setOption(QFileDialog.ShowDirsOnly, True)
 
         # Setup UI
         self._setup_ui()
@@ -58,8 +105,9 @@ class PredictionWindow(QWidget):
         main_layout.addWidget(model_controls)
 
         # Prediction overlay (charts)
-        if ML_AVAILABLE:
-            self.prediction_overlay = PredictionOverlay()
+        if _ensure_ml():
+            self.prediction_overlay = _ML_STATE['PredictionOverlay']()
+            self.prediction_overlay.refresh_requested.connect(self._on_auto_refresh)
             main_layout.addWidget(self.prediction_overlay, stretch=3)
         else:
             placeholder = QLabel("ML components not available.\nInstall required dependencies (scikit-learn, xgboost).")
@@ -70,8 +118,9 @@ class PredictionWindow(QWidget):
         log_group = QGroupBox("Prediction Log")
         log_layout = QVBoxLayout()
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_text.setMaximumHeight(150)
         log_layout.addWidget(self.log_text)
 
@@ -98,7 +147,7 @@ class PredictionWindow(QWidget):
         layout.addWidget(self.model_status_label)
 
         # Auto-refresh toggle
-        if ML_AVAILABLE:
+        if _ensure_ml():
             self.auto_refresh_cb = QCheckBox("Auto-Refresh (5s)")
             self.auto_refresh_cb.stateChanged.connect(self._on_auto_refresh_changed)
             layout.addWidget(self.auto_refresh_cb)
@@ -125,16 +174,27 @@ class PredictionWindow(QWidget):
         Args:
             models_dir: Path to models directory
         """
-        if not ML_AVAILABLE:
+        if not _ensure_ml():
             self._log("ML components not available")
             return
 
         try:
             self._log(f"Loading models from {models_dir}...")
 
-            # Create predictor
-            self.predictor = RealTimePredictor()
-            self.predictor.load_models(models_dir)
+            # Reuse a predictor already loaded from this directory
+            key = (models_dir, max((p.stat().st_mtime for p in Path(models_dir).glob('*')), default=0.0))
+            predictor = self._predictor_cache.get(key)
+            if predictor is None:
+                predictor = _ML_STATE['RealTimePredictor']()
+                predictor.load_models(models_dir)
+                predictor.compile_all()
+                self._predictor_cache[key] = predictor
+            else:
+                self._log("Using cached models")
+
+            self.predictor = predictor
+            self._pred_cache.clear()
+            self._last_state_hash = None
 
             # Connect to overlay
             self.prediction_overlay.set_predictor(self.predictor)
@@ -155,20 +215,52 @@ class PredictionWindow(QWidget):
             self.model_status_label.setText("Error ✗")
             self.model_status_label.setStyleSheet("color: red;")
 
-    def update_predictions(self, current_state: Dict):
+    def update_predictions(self, current_state: Dict, force: bool = False):
         """
         Update predictions with current state
 
         Args:
             current_state: Current race state
+            force: Update even if the race state is unchanged
         """
-        if not self.predictor or not ML_AVAILABLE:
+        if not self.predictor or not _ensure_ml():
             self._log("Predictor not initialized")
             return
 
+        self._latest_state = current_state
+
+        # Skip when the coarse prediction inputs haven't changed
+        state_hash = hash((
+            current_state.get('current_lap'),
+            current_state.get('current_position'),
+            current_state.get('current_compound'),
+            current_state.get('tyre_age')
+        ))
+        if state_hash == self._last_state_hash and not force:
+            return
+        self._last_state_hash = state_hash
+
         try:
-            # Update overlay
-            self.prediction_overlay.update(current_state)
+            # Reuse predictions for a state we've already seen
+            key = (
+                current_state.get('current_lap'),
+                current_state.get('current_position'),
+                current_state.get('current_compound'),
+                current_state.get('tyre_age'),
+                round(current_state.get('avg_wear', 0), 1),
+                round(current_state.get('fuel_remaining', 0), 1)
+            )
+            cached = self._pred_cache.get(key)
+            if cached is not None:
+                self._pred_cache.move_to_end(key)
+                self.prediction_overlay.update(current_state, predictions=cached)
+            else:
+                self.prediction_overlay.update(current_state)
+                predictions = self.prediction_overlay.get_last_predictions()
+                if predictions is not None:
+                    self._pred_cache[key] = predictions
+                    if len(self._pred_cache) > PREDICTION_CACHE_SIZE:
+                        self._pred_cache.popitem(last=False)
 
             # Log summary
             lap = current_state.get('current_lap', 0)
@@ -180,40 +272,24 @@ class PredictionWindow(QWidget):
 
     def _load_models(self):
         """Load models button clicked"""
-        models_dir = QFileDialog.getExistingDirectory(
-            self,
-            "Select Models Directory",
-            "models"
-        )
-
-        if models_dir:
-            self.load_models(models_dir)
+        if self._models_dlg.exec():
+            self.load_models(self._models_dlg.selectedFiles()[0])
 
     def _update_now(self):
         """Update now button clicked"""
         # Demo update with simulated state
-        demo_state = {
-            'current_lap': 25,
-            'current_position': 5,
-            'tyre_age': 15,
-            'avg_wear': 52.0,
-            'total_laps': 50,
-            'current_lap_time': 87000,
-            'base_lap_time': 85000,
-            'fuel_remaining': 35.0
-        }
-
-        self.update_predictions(demo_state)
+        self.update_predictions(DEMO_STATE, force=True)
 
     def _clear_history(self):
         """Clear prediction history"""
-        if ML_AVAILABLE and hasattr(self, 'prediction_overlay'):
+        if _ensure_ml() and hasattr(self, 'prediction_overlay'):
             self.prediction_overlay.clear_history()
+            self._last_state_hash = None
             self._log("Prediction history cleared")
 
     def _on_auto_refresh_changed(self, state):
         """Auto-refresh toggle changed"""
-        if not ML_AVAILABLE:
+        if not _ensure_ml():
             return
 
         if state == Qt.Checked:
@@ -223,8 +299,12 @@ class PredictionWindow(QWidget):
             self.prediction_overlay.stop_auto_refresh()
             self._log("Auto-refresh disabled")
 
+    def _on_auto_refresh(self):
+        """Auto-refresh tick: re-run predictions if the latest state has changed"""
+        if self._latest_state is not None:
+            self.update_predictions(self._latest_state)
+
     def _log(self, message: str):
         """Add message to log"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        timestamp = time.strftime("%H:%M:%S")
+        self.log_text.appendPlainText(f"[{timestamp}] {message}")
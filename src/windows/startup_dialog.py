@@ -6,9 +6,51 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                                 QLabel, QFileDialog, QRadioButton, QButtonGroup,
                                 QWidget, QGroupBox)
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtGui import QFont
+from functools import lru_cache, partial
 from pathlib import Path
 
+START_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px 30px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+OPTION_BOX_QSS = """
+    QGroupBox {
+        border: 2px solid #ddd;
+        border-radius: 10px;
+        padding: 20px;
+        margin-top: 10px;
+    }
+    QGroupBox:hover {
+        border-color: #4CAF50;
+    }
+"""
+
+FILE_LABEL_QSS = "color: #666; padding: 5px; border: 1px solid #ddd; border-radius: 3px;"
+FILE_LABEL_SELECTED_QSS = "color: #000; padding: 5px; border: 1px solid #4CAF50; border-radius: 3px;"
+
+
+@lru_cache(maxsize=None)
+def dialog_font(point_size, bold=False):
+    """Shared dialog fonts, built on first use (a QApplication must exist)"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
 
 class StartupDialog(QDialog):
     """Dialog shown at startup to choose data source"""
@@ -24,6 +66,11 @@ class StartupDialog(QDialog):
         self.selected_mode = None
         self.selected_file = None
 
+        # Recording picker, reused so it remembers the last folder
+        self._file_dlg = QFileDialog(self, "Select Telemetry Recording", str(Path.home()))
+        self._file_dlg.setFileMode(QFileDialog.ExistingFile)
+        self._file_dlg.setNameFilters(["Telemetry Files (*.bin)", "All Files (*.*)"])
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -33,18 +80,13 @@ class StartupDialog(QDialog):
 
         # Title
         title = QLabel("🏁 F1 Telemetry Application")
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(dialog_font(24, bold=True))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
         # Subtitle
         subtitle = QLabel("Choose your data source to get started")
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(12)
-        subtitle.setFont(subtitle_font)
+        subtitle.setFont(dialog_font(12))
         subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setStyleSheet("color: #666;")
         layout.addWidget(subtitle)
@@ -93,7 +135,7 @@ class StartupDialog(QDialog):
 
         file_btn_layout = QHBoxLayout()
         self.file_path_label = QLabel("No file selected")
-        self.file_path_label.setStyleSheet("color: #666; padding: 5px; border: 1px solid #ddd; border-radius: 3px;")
+        self.file_path_label.setStyleSheet(FILE_LABEL_QSS)
         file_btn_layout.addWidget(self.file_path_label, 1)
 
         self.browse_btn = QPushButton("Browse...")
@@ -118,22 +160,7 @@ class StartupDialog(QDialog):
 
         self.start_btn = QPushButton("Start Application")
         self.start_btn.setEnabled(False)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 30px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.start_btn.setStyleSheet(START_BUTTON_QSS)
         self.start_btn.clicked.connect(self.start_application)
         buttons_layout.addWidget(self.start_btn)
 
@@ -144,27 +171,14 @@ class StartupDialog(QDialog):
     def create_option_box(self, title, description, mode):
         """Create an option box with radio button"""
         group_box = QGroupBox()
-        group_box.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #ddd;
-                border-radius: 10px;
-                padding: 20px;
-                margin-top: 10px;
-            }
-            QGroupBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
+        group_box.setStyleSheet(OPTION_BOX_QSS)
 
         layout = QVBoxLayout()
 
         # Radio button with title
         radio = QRadioButton(title)
-        radio_font = QFont()
-        radio_font.setPointSize(14)
-        radio_font.setBold(True)
-        radio.setFont(radio_font)
-        radio.toggled.connect(lambda checked: self.on_mode_changed(mode, checked))
+        radio.setFont(dialog_font(14, bold=True))
+        radio.toggled.connect(partial(self.on_mode_changed, mode))
         layout.addWidget(radio)
 
         # Description
@@ -181,10 +195,14 @@ class StartupDialog(QDialog):
         self.radio_buttons[mode] = radio
 
         # Make the whole box clickable
-        group_box.mousePressEvent = lambda event: radio.setChecked(True)
+        group_box.mousePressEvent = partial(self._check_radio, radio)
 
         return group_box
 
+    def _check_radio(self, radio, event):
+        """Select an option when its box is clicked"""
+        radio.setChecked(True)
+
     def on_mode_changed(self, mode, checked):
         """Handle mode selection change"""
         if checked:
@@ -202,17 +220,11 @@ class StartupDialog(QDialog):
 
     def browse_file(self):
         """Open file browser to select telemetry file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Telemetry Recording",
-            str(Path.home()),
-            "Telemetry Files (*.bin);;All Files (*.*)"
-        )
-
-        if file_path:
+        if self._file_dlg.exec():
+            file_path = self._file_dlg.selectedFiles()[0]
             self.selected_file = file_path
             self.file_path_label.setText(Path(file_path).name)
-            self.file_path_label.setStyleSheet("color: #000; padding: 5px; border: 1px solid #4CAF50; border-radius: 3px;")
+            self.file_path_label.setStyleSheet(FILE_LABEL_SELECTED_QSS)
             self.start_btn.setEnabled(True)
 
     def start_application(self):
@@ -20,18 +20,184 @@ Usage:
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QPushButton, QLabel, QSpinBox, QComboBox, QTextEdit, QTableWidget,
-    QTableWidgetItem, QHeaderView
+    QPushButton, QLabel, QSpinBox, QComboBox, QPlainTextEdit, QTableView,
+    QHeaderView
 )
-from PySide6.QtCore import Qt
-from typing import Dict, Optional
-
-try:
-    from ..visualization import StrategySimulator
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QAbstractTableModel, QModelIndex, QSignalBlocker,
+    QStandardPaths
+)
+from PySide6.QtGui import QColor, QFont
+from functools import lru_cache, partial
+from pathlib import Path
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
     from ..ml.models import StrategyRecommender, PitStopOptimizer
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
+
+# ML components are imported on first use so opening the app doesn't pull in sklearn/xgboost
+_ML_STATE: Dict = {}
+
+
+def _ensure_ml() -> bool:
+    """Import the ML components once and report whether they are available"""
+    if 'available' not in _ML_STATE:
+        try:
+            from ..visualization import StrategySimulator
+            from ..ml.models import StrategyRecommender, PitStopOptimizer, STATE_FIELDS, featurize_state, state_key
+        except ImportError:
+            _ML_STATE['available'] = False
+        else:
+            _ML_STATE.update(
+                available=True, StrategySimulator=StrategySimulator, StrategyRecommender=StrategyRecommender,
+                PitStopOptimizer=PitStopOptimizer, STATE_FIELDS=STATE_FIELDS, featurize_state=featurize_state,
+                state_key=state_key
+            )
+    return _ML_STATE['available']
+
+
+# version only keys the disk cache, see _disk_cache()
+def _recommend_for_key(key: tuple, version: str, recommender) -> Dict:
+    """Strategy recommendations for a state key"""
+    state = dict(zip(_ML_STATE['STATE_FIELDS'], key))
+    features = _ML_STATE['featurize_state'](state)
+    return recommender.recommend_strategy(state, max_strategies=5, features=features)
+
+
+def _optimize_pit_for_key(key: tuple, version: str, pit_optimizer) -> Dict:
+    """Pit window analysis for a state key"""
+    state = dict(zip(_ML_STATE['STATE_FIELDS'], key))
+    features = _ML_STATE['featurize_state'](state)
+    return pit_optimizer.optimize_pit_window(state, features=features)
+
+
+# Analyses also persist on disk across restarts (joblib.Memory, set up on first use)
+_DISK_CACHE: Dict = {}
+_DISK_CACHE_LOCK = threading.Lock()
+MODELS_DIR = Path(__file__).resolve().parent.parent / 'ml' / 'models'
+
+
+def _disk_cache() -> Dict:
+    """
+    The on-disk cache and the cached analysis functions
+
+    Results are stored in the per-user cache directory and keyed on the state tuple and
+    the version of the model code. The model instances use default settings, so they
+    aren't hashed.
+    """
+    with _DISK_CACHE_LOCK:
+        if not _DISK_CACHE:
+            # Any change to the strategy model sources invalidates the stored results
+            digest = hashlib.sha1()
+            for source in sorted(MODELS_DIR.glob('*.py')):
+                digest.update(source.read_bytes())
+            _DISK_CACHE.update(
+                memory=None, version=digest.hexdigest(),
+                recommend=_recommend_for_key, optimize_pit=_optimize_pit_for_key
+            )
+            try:
+                from joblib import Memory
+            except ImportError:
+                pass
+            else:
+                location = Path(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation) or Path.home() / '.cache')
+                memory = Memory(location / 'f1_hawkeye' / 'strategy', verbose=0)
+                _DISK_CACHE.update(
+                    memory=memory,
+                    recommend=memory.cache(_recommend_for_key, ignore=['recommender']),
+                    optimize_pit=memory.cache(_optimize_pit_for_key, ignore=['pit_optimizer'])
+                )
+        return _DISK_CACHE
+
+
+def _warm_up(pit_optimizer):
+    """Compile the pit optimizer's scoring kernel (runs on a pool thread)"""
+    try:
+        pit_optimizer.warm_up()
+    except Exception as e:
+        print(f"Error compiling pit optimizer: {e}")
+
+
+class AnalysisSignals(QObject):
+    """Signals for StrategyAnalysisTask (QRunnable can't emit on its own)"""
+    done = Signal(object)  # analysis result (None on failure)
+
+
+class StrategyAnalysisTask(QRunnable):
+    """Runs one strategy model for a state key on a pool thread"""
+
+    def __init__(self, analyze, key: tuple, error_label: str):
+        super().__init__()
+        self.analyze = analyze
+        self.key = key
+        self.error_label = error_label
+        self.signals = AnalysisSignals()
+
+    def run(self):
+        result = None
+        try:
+            result = self.analyze(self.key)
+        except Exception as e:
+            print(f"Error {self.error_label}: {e}")
+        self.signals.done.emit(result)
+
+
+class StrategyTableModel(QAbstractTableModel):
+    """Strategy recommendations, recommended strategy first"""
+
+    HEADER = ['Strategy', 'Pit Laps', 'Expected Pos', 'Podium %', 'Risk']
+    RISK_COLORS = {'HIGH': QColor(Qt.red), 'MEDIUM': QColor(Qt.darkYellow)}
+    LOW_RISK_COLOR = QColor(Qt.darkGreen)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[list] = []
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def setRows(self, strategies):
+        """Replace all rows in one model reset"""
+        self.beginResetModel()
+        self._rows = [
+            [
+                strategy.name[:30],
+                ', '.join(map(str, strategy.pit_laps)) if strategy.pit_laps else 'None',
+                f"P{strategy.expected_position}",
+                f"{strategy.podium_probability * 100:.0f}%",
+                strategy.risk_level
+            ]
+            for strategy in strategies
+        ]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADER)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+
+        if role == Qt.ForegroundRole and index.column() == 4:
+            return self.RISK_COLORS.get(self._rows[index.row()][4], self.LOW_RISK_COLOR)
+
+        # Highlight recommended (first row)
+        if role == Qt.FontRole and index.row() == 0:
+            return self._bold_font
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADER[section]
+        return None
 
 
 class StrategyWindow(QWidget):
@@ -47,17 +213,26 @@ class StrategyWindow(QWidget):
         self.recommender: Optional['StrategyRecommender'] = None
         self.pit_optimizer: Optional['PitStopOptimizer'] = None
         self.current_state: Dict = {}
+        self._inflight = 0  # analysis tasks still running
+        self._last_rec_fingerprint = None  # strategies currently shown in the table
+
+        # Repeat analyses of the same inputs are served from memory (failures aren't cached)
+        self._recommend_cached = lru_cache(maxsize=64)(self._recommend)
+        self._optimize_pit_cached = lru_cache(maxsize=64)(self._optimize_pit)
 
         # Setup UI
         self._setup_ui()
 
         # Initialize ML models
-        if ML_AVAILABLE:
+        if _ensure_ml():
             try:
-                self.recommender = StrategyRecommender()
-                self.pit_optimizer = PitStopOptimizer()
-            except:
-                pass
+                self.recommender = _ML_STATE['StrategyRecommender']()
+                self.pit_optimizer = _ML_STATE['PitStopOptimizer']()
+            except Exception as e:
+                print(f"Error initializing strategy models: {e}")
+            else:
+                # The first compile takes seconds, keep it off the UI thread
+                QThreadPool.globalInstance().start(partial(_warm_up, self.pit_optimizer))
 
     def _setup_ui(self):
         """Setup window layout"""
@@ -66,8 +241,8 @@ class StrategyWindow(QWidget):
         # Left side: Strategy simulator
         left_side = QVBoxLayout()
 
-        if ML_AVAILABLE:
-            self.strategy_simulator = StrategySimulator()
+        if _ensure_ml():
+            self.strategy_simulator = _ML_STATE['StrategySimulator']()
             left_side.addWidget(self.strategy_simulator, stretch=3)
         else:
             placeholder = QLabel("ML components not available.\nInstall required dependencies.")
@@ -137,6 +312,7 @@ class StrategyWindow(QWidget):
         params_layout2.addWidget(QLabel("Compound:"))
         self.compound_combo = QComboBox()
         self.compound_combo.addItems(['SOFT', 'MEDIUM', 'HARD'])
+        self._compound_idx = {'SOFT': 0, 'MEDIUM': 1, 'HARD': 2}
         self.compound_combo.setCurrentText('MEDIUM')
         params_layout2.addWidget(self.compound_combo)
 
@@ -145,7 +321,14 @@ class StrategyWindow(QWidget):
         # Analyze button
         self.analyze_btn = QPushButton("Analyze Strategies")
         self.analyze_btn.clicked.connect(self._analyze_strategies)
-        layout.addWidget(self.analyze_btn)
+
+        self.clear_cache_btn = QPushButton("Clear Cache")
+        self.clear_cache_btn.clicked.connect(self._clear_cache)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addWidget(self.analyze_btn, stretch=1)
+        buttons_layout.addWidget(self.clear_cache_btn)
+        layout.addLayout(buttons_layout)
 
         group.setLayout(layout)
         return group
@@ -155,11 +338,9 @@ class StrategyWindow(QWidget):
         group = QGroupBox("Strategy Recommendations")
         layout = QVBoxLayout()
 
-        self.rec_table = QTableWidget()
-        self.rec_table.setColumnCount(5)
-        self.rec_table.setHorizontalHeaderLabels([
-            'Strategy', 'Pit Laps', 'Expected Pos', 'Podium %', 'Risk'
-        ])
+        self.rec_model = StrategyTableModel(self)
+        self.rec_table = QTableView()
+        self.rec_table.setModel(self.rec_model)
         self.rec_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.rec_table.setAlternatingRowColors(True)
 
@@ -173,7 +354,7 @@ class StrategyWindow(QWidget):
         group = QGroupBox("Pit Stop Analysis")
         layout = QVBoxLayout()
 
-        self.pit_text = QTextEdit()
+        self.pit_text = QPlainTextEdit()
         self.pit_text.setReadOnly(True)
         self.pit_text.setMaximumHeight(200)
 
@@ -191,21 +372,22 @@ class StrategyWindow(QWidget):
         """
         self.current_state = state
 
-        # Update UI
-        if 'current_lap' in state:
-            self.lap_spin.setValue(state['current_lap'])
-        if 'total_laps' in state:
-            self.total_laps_spin.setValue(state['total_laps'])
-        if 'current_position' in state:
-            self.pos_spin.setValue(state['current_position'])
-        if 'current_compound' in state:
-            idx = self.compound_combo.findText(state['current_compound'])
-            if idx >= 0:
+        # Update UI without emitting a change signal per control
+        with QSignalBlocker(self.lap_spin), QSignalBlocker(self.total_laps_spin), \
+                QSignalBlocker(self.pos_spin), QSignalBlocker(self.compound_combo):
+            if 'current_lap' in state:
+                self.lap_spin.setValue(state['current_lap'])
+            if 'total_laps' in state:
+                self.total_laps_spin.setValue(state['total_laps'])
+            if 'current_position' in state:
+                self.pos_spin.setValue(state['current_position'])
+            idx = self._compound_idx.get(state.get('current_compound'))
+            if idx is not None:
                 self.compound_combo.setCurrentIndex(idx)
 
     def _analyze_strategies(self):
         """Analyze button clicked"""
-        if not ML_AVAILABLE:
+        if not _ensure_ml():
             return
 
         # Build state from UI
@@ -220,28 +402,64 @@ class StrategyWindow(QWidget):
 
         self.current_state = state
 
-        # Get strategy recommendations
+        # Run each model on its own pool thread; each result is shown as soon as it arrives
+        key = _ML_STATE['state_key'](state)
+        tasks = []
         if self.recommender:
-            try:
-                result = self.recommender.recommend_strategy(state, max_strategies=5)
+            tasks.append((StrategyAnalysisTask(self._recommend_cached, key, "analyzing strategies"),
+                          self._on_recommendations_ready))
+        if self.pit_optimizer:
+            tasks.append((StrategyAnalysisTask(self._optimize_pit_cached, key, "analyzing pit stops"),
+                          self._on_pit_analysis_ready))
+
+        self._inflight = len(tasks)
+        self.analyze_btn.setEnabled(not tasks)
+        for task, slot in tasks:
+            task.signals.done.connect(slot)
+            QThreadPool.globalInstance().start(task)
+
+    def _recommend(self, key: tuple) -> Dict:
+        """Strategy recommendations for a state key (wrapped by _recommend_cached)"""
+        cache = _disk_cache()
+        return cache['recommend'](key, cache['version'], self.recommender)
+
+    def _optimize_pit(self, key: tuple) -> Dict:
+        """Pit window analysis for a state key (wrapped by _optimize_pit_cached)"""
+        cache = _disk_cache()
+        return cache['optimize_pit'](key, cache['version'], self.pit_optimizer)
+
+    def _clear_cache(self):
+        """Forget cached analyses, in memory and on disk"""
+        self._recommend_cached.cache_clear()
+        self._optimize_pit_cached.cache_clear()
+        memory = _disk_cache()['memory']
+        if memory is not None:
+            memory.clear(warn=False)
+
+    def _on_recommendations_ready(self, result: Optional[Dict]):
+        """Show strategy recommendations (runs on the UI thread)"""
+        self._task_done()
+        if result is None:
+            return
 
-                # Update simulator
-                if hasattr(self, 'strategy_simulator'):
-                    self.strategy_simulator.compare_strategies(state, max_strategies=5)
+        # Update simulator
+        if hasattr(self, 'strategy_simulator'):
+            self.strategy_simulator.compare_strategies(self.current_state, max_strategies=5, result=result)
 
-                # Update recommendations table
-                self._update_recommendations_table(result)
+        # Update recommendations table
+        self._update_recommendations_table(result)
 
-            except Exception as e:
-                print(f"Error analyzing strategies: {e}")
+    def _on_pit_analysis_ready(self, pit_result: Optional[Dict]):
+        """Show pit stop analysis (runs on the UI thread)"""
+        self._task_done()
+        if pit_result is not None:
+            self._update_pit_analysis(pit_result)
 
-        # Get pit stop analysis
-        if self.pit_optimizer:
-            try:
-                pit_result = self.pit_optimizer.optimize_pit_window(state)
-                self._update_pit_analysis(pit_result)
-            except Exception as e:
-                print(f"Error analyzing pit stops: {e}")
+    def _task_done(self):
+        """Re-enable Analyze once every task of the current run has reported back"""
+        self._inflight -= 1
+        if self._inflight <= 0:
+            self.analyze_btn.setEnabled(True)
 
     def _update_recommendations_table(self, result: Dict):
         """Update recommendations table with results"""
@@ -253,60 +471,39 @@ class StrategyWindow(QWidget):
             all_strategies.append(recommended)
         all_strategies.extend(alternatives)
 
-        # Clear and populate table
-        self.rec_table.setRowCount(len(all_strategies))
-
-        for row, strategy in enumerate(all_strategies):
-            # Strategy name
-            self.rec_table.setItem(row, 0, QTableWidgetItem(strategy.name[:30]))
-
-            # Pit laps
-            pit_laps_str = ', '.join(map(str, strategy.pit_laps)) if strategy.pit_laps else 'None'
-            self.rec_table.setItem(row, 1, QTableWidgetItem(pit_laps_str))
-
-            # Expected position
-            self.rec_table.setItem(row, 2, QTableWidgetItem(f"P{strategy.expected_position}"))
-
-            # Podium probability
-            podium_pct = f"{strategy.podium_probability * 100:.0f}%"
-            self.rec_table.setItem(row, 3, QTableWidgetItem(podium_pct))
+        # Skip the repaint when the strategies shown haven't changed
+        fingerprint = tuple(
+            (s.name, tuple(s.pit_laps or ()), s.expected_position, round(s.podium_probability, 3), s.risk_level)
+            for s in all_strategies
+        )
+        if fingerprint == self._last_rec_fingerprint:
+            return
+        self._last_rec_fingerprint = fingerprint
 
-            # Risk level
-            risk_item = QTableWidgetItem(strategy.risk_level)
-            if strategy.risk_level == 'HIGH':
-                risk_item.setForeground(Qt.red)
-            elif strategy.risk_level == 'MEDIUM':
-                risk_item.setForeground(Qt.darkYellow)
-            else:
-                risk_item.setForeground(Qt.darkGreen)
-            self.rec_table.setItem(row, 4, risk_item)
-
-            # Highlight recommended (first row)
-            if row == 0:
-                for col in range(5):
-                    item = self.rec_table.item(row, col)
-                    if item:
-                        font = item.font()
-                        font.setBold(True)
-                        item.setFont(font)
+        # Repopulate table in one reset
+        self.rec_model.setRows(all_strategies)
 
     def _update_pit_analysis(self, pit_result: Dict):
         """Update pit stop analysis text"""
-        text = "🏁 PIT STOP OPTIMIZATION\n\n"
-
-        text += f"Optimal Pit Lap: {pit_result['optimal_pit_lap']}\n"
-        text += f"Expected Position: P{pit_result['expected_position']:.1f}\n"
-        text += f"Position Change: {pit_result['position_change']:+.1f}\n\n"
-
-        text += f"Undercut Potential: {pit_result['undercut_potential']:.2f}\n"
-        text += f"Overcut Potential: {pit_result['overcut_potential']:.2f}\n"
-        text += f"Risk Score: {pit_result['risk_score']:.2f}\n\n"
-
-        text += f"Recommendation:\n{pit_result['recommendation']}\n\n"
-
-        # Alternatives
-        text += "Alternative Pit Laps:\n"
-        for alt in pit_result.get('alternatives', [])[:3]:
-            text += f"  Lap {alt['pit_lap']}: P{alt['expected_position']:.1f} (risk {alt['risk_score']:.2f})\n"
-
-        self.pit_text.setText(text)
+        parts = [
+            "🏁 PIT STOP OPTIMIZATION",
+            "",
+            f"Optimal Pit Lap: {pit_result['optimal_pit_lap']}",
+            f"Expected Position: P{pit_result['expected_position']:.1f}",
+            f"Position Change: {pit_result['position_change']:+.1f}",
+            "",
+            f"Undercut Potential: {pit_result['undercut_potential']:.2f}",
+            f"Overcut Potential: {pit_result['overcut_potential']:.2f}",
+            f"Risk Score: {pit_result['risk_score']:.2f}",
+            "",
+            f"Recommendation:\n{pit_result['recommendation']}",
+            "",
+            # Alternatives
+            "Alternative Pit Laps:"
+        ]
+        parts.extend(
+            f"  Lap {alt['pit_lap']}: P{alt['expected_position']:.1f} (risk {alt['risk_score']:.2f})"
+            for alt in pit_result.get('alternatives', [])[:3]
+        )
+
+        self.pit_text.setPlainText("\n".join(parts))
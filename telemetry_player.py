@@ -8,12 +8,186 @@ Usage:
 Start Telemetry.py first, then run this to replay the recording!
 """
 
+import ctypes
+import ctypes.util
+import mmap
+import os
 import socket
 import time
 import argparse
 import struct
 import sys
 
+# Recording file layout: [timestamp <d][length <I][payload] per packet
+_HDR = struct.Struct('<dI')
+_SEGMENT_SIZE = struct.Struct('H')  # UDP_SEGMENT cmsg payload
+
+# Packets due within BATCH_WINDOW seconds of each other go out in one sendmmsg() call
+SEND_BATCH = 16
+BATCH_WINDOW = 0.001
+
+# When playback falls behind (high --speed), groups whose deadline has already passed are
+# merged into one sendmmsg() burst of up to DRAIN_BATCH packets
+DRAIN_BATCH = 32
+
+# Pacing: sleep only for waits longer than SLEEP_THRESHOLD_NS, waking SPIN_MARGIN_NS early,
+# then spin on perf_counter_ns() to hit the deadline without the kernel's timer slack
+SLEEP_THRESHOLD_NS = 200_000
+SPIN_MARGIN_NS = 100_000
+
+PR_SET_TIMERSLACK = 29
+
+# UDP generic segmentation offload (Linux 4.18+): one sendmsg() carries a run of
+# equal-sized datagrams that the kernel splits back up
+SOL_UDP = getattr(socket, 'SOL_UDP', 17)
+UDP_SEGMENT = 103
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),  # NULL: the socket is connected
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),  # _IOVec *
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+# sendmmsg(2) is Linux-only; other platforms send each packet with send()
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+        _libc.sendmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc = None
+SENDMMSG_AVAILABLE = _libc is not None
+
+
+def wait_until(deadline_ns):
+    """Sleep/spin hybrid: return as close to the perf_counter_ns() deadline as possible"""
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining > SLEEP_THRESHOLD_NS:
+        time.sleep((remaining - SPIN_MARGIN_NS) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+
+def tune_timing():
+    """Best effort: real-time scheduling and 1 ns timer slack for tighter pacing (Linux)"""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(os.sched_get_priority_min(os.SCHED_FIFO)))
+    except (AttributeError, OSError):
+        pass  # Not Linux, or no CAP_SYS_NICE
+    if _libc is not None:
+        _libc.prctl(PR_SET_TIMERSLACK, ctypes.c_ulong(1), ctypes.c_ulong(0), ctypes.c_ulong(0), ctypes.c_ulong(0))
+
+
+def plan_playback(buf, size, speed, gso):
+    """Index a mapped recording and group its packets into send calls ahead of playback
+
+    Returns (timestamps, spans, groups). spans holds each packet's (start, end) payload
+    offsets. Each group is (first, end, deadline_ns, segment): packets first..end-1 go out
+    together once deadline_ns has passed since playback started (None: same batch as the
+    previous group, send right away); segment is their shared length for a GSO run, else 0.
+    """
+    unpack = _HDR.unpack_from
+    timestamps = []
+    spans = []
+    off = 0
+    while off + _HDR.size <= size:
+        timestamp, packet_length = unpack(buf, off)
+        start = off + _HDR.size
+        end = start + packet_length
+        if end > size:
+            break  # Truncated last packet
+        timestamps.append(timestamp)
+        spans.append((start, end))
+        off = end
+
+    groups = []
+    count = len(spans)
+    i = 0
+    while i < count:
+        # Batch: packets due within BATCH_WINDOW of the first one, up to SEND_BATCH of them
+        batch_timestamp = timestamps[i]
+        j = i + 1
+        while (j < count and j - i < SEND_BATCH
+               and (timestamps[j] - batch_timestamp) / speed <= BATCH_WINDOW):
+            j += 1
+        deadline_ns = int((batch_timestamp - timestamps[0]) * 1e9 / speed)
+
+        # Split the batch into GSO runs of equal-length packets and plain sendmmsg() groups
+        plain = i
+        k = i
+        while k < j:
+            length = spans[k][1] - spans[k][0]
+            run_end = k + 1
+            while gso and run_end < j and spans[run_end][1] - spans[run_end][0] == length:
+                run_end += 1
+            if run_end - k > 1:
+                if plain < k:
+                    groups.append((plain, k, deadline_ns, 0))
+                    deadline_ns = None
+                groups.append((k, run_end, deadline_ns, length))
+                deadline_ns = None
+                plain = run_end
+            k = run_end
+        if plain < j:
+            groups.append((plain, j, deadline_ns, 0))
+        i = j
+
+    return timestamps, spans, groups
+
+
+class SendPlan:
+    """sendmmsg() headers for DRAIN_BATCH packets of a mapped recording, refilled per call
+
+    The header array has a fixed size, so memory and setup time don't grow with the
+    length of the recording.
+    """
+
+    def __init__(self, base, spans):
+        self.base = base
+        self.spans = spans
+        self.iovecs = (_IOVec * DRAIN_BATCH)()
+        self.msgs = (_MMsgHdr * DRAIN_BATCH)()
+        iov_address = ctypes.addressof(self.iovecs)
+        iov_size = ctypes.sizeof(_IOVec)
+        for i in range(DRAIN_BATCH):
+            hdr = self.msgs[i].msg_hdr
+            hdr.msg_iov = iov_address + i * iov_size
+            hdr.msg_iovlen = 1
+        self.address = ctypes.addressof(self.msgs)
+
+    def send(self, fd, first, end):
+        """Send packets first..end-1 with as few calls as possible, return how many went out"""
+        sent = 0
+        while first + sent < end:
+            count = min(end - first - sent, DRAIN_BATCH)
+            for iov, (start, stop) in zip(self.iovecs, self.spans[first + sent:first + sent + count]):
+                iov.iov_base = self.base + start
+                iov.iov_len = stop - start
+            result = _libc.sendmmsg(fd, self.address, count, 0)
+            if result <= 0:
+                break
+            sent += result
+            if result < count:
+                break
+        return sent
+
+
 class TelemetryPlayer:
     def __init__(self, input_file, port=20777, host='127.0.0.1', speed=1.0, loop=False):
         self.input_file = input_file
@@ -22,6 +196,7 @@ class TelemetryPlayer:
         self.speed = speed
         self.loop = loop
         self.sock = None
+        self.gso = False
 
     def play(self):
         """Play back the recording"""
@@ -37,7 +212,16 @@ class TelemetryPlayer:
         try:
             # Create UDP socket
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            target = (self.host, self.port)
+            tune_timing()
+
+            # Probe UDP GSO; a segment size of 0 keeps ordinary sends unsegmented
+            try:
+                self.sock.setsockopt(SOL_UDP, UDP_SEGMENT, 0)
+                self.gso = True
+            except OSError:
+                self.gso = False
+            # Connect once so every send skips the per-packet destination lookup
+            self.sock.connect((self.host, self.port))
 
             play_count = 0
             while True:
@@ -45,7 +229,7 @@ class TelemetryPlayer:
                 if self.loop and play_count > 1:
                     print(f"\n🔁 Loop iteration {play_count}")
 
-                packets_sent = self.play_once(target)
+                packets_sent = self.play_once()
 
                 if not self.loop:
                     break
@@ -68,52 +252,101 @@ class TelemetryPlayer:
             if self.sock:
                 self.sock.close()
 
-    def play_once(self, target):
+    def play_once(self):
         """Play the recording once"""
         packets_sent = 0
         last_timestamp = 0
 
-        with open(self.input_file, 'rb') as f:
-            print(f"\n▶️  Starting playback...\n")
-            start_time = time.time()
-
-            while True:
-                # Read timestamp (8 bytes double)
-                timestamp_bytes = f.read(8)
-                if len(timestamp_bytes) < 8:
-                    break  # End of file
-
-                timestamp = struct.unpack('<d', timestamp_bytes)[0]
-
-                # Read packet length (4 bytes unsigned int)
-                length_bytes = f.read(4)
-                if len(length_bytes) < 4:
-                    break
-
-                packet_length = struct.unpack('<I', length_bytes)[0]
-
-                # Read packet data
-                packet_data = f.read(packet_length)
-                if len(packet_data) < packet_length:
-                    break
+        # Map the whole recording: headers are parsed in place and payloads are sent
+        # straight from the mapping, so there are no read() calls or intermediate copies.
+        # sendmmsg() needs raw addresses, which ctypes only hands out for a writable
+        # buffer, so that path maps copy-on-write (nothing is ever written)
+        access = mmap.ACCESS_COPY if SENDMMSG_AVAILABLE else mmap.ACCESS_READ
+        fd = os.open(self.input_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            mm = mmap.mmap(fd, 0, access=access) if size else None
+        finally:
+            os.close(fd)
 
-                # Wait for the appropriate time (adjusted by speed multiplier)
-                if packets_sent > 0:
-                    delay = (timestamp - last_timestamp) / self.speed
-                    if delay > 0:
-                        time.sleep(delay)
+        mv = memoryview(mm) if mm is not None else b''
+        anchor = ctypes.c_char.from_buffer(mm) if mm is not None and SENDMMSG_AVAILABLE else None
+        try:
+            if mm is not None and hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)  # Linux readahead hint
+
+            # All per-packet work (header parsing, batching, send headers) happens here, so
+            # the timed loop below only runs once per send call
+            timestamps, spans, groups = plan_playback(mv, size, self.speed, self.gso)
+            plan = SendPlan(ctypes.addressof(anchor), spans) if anchor is not None else None
+
+            # The connected socket reports ICMP port-unreachable as ECONNREFUSED on a later
+            # send; nobody is listening yet, so that packet is simply dropped as before
+
+            def send_each(first, end):
+                """Send packets individually, falling back to send() for whatever sendmmsg() missed"""
+                sent = plan.send(self.sock.fileno(), first, end) if plan else 0
+                for start, stop in spans[first + sent:end]:
+                    try:
+                        self.sock.send(mv[start:stop])
+                    except ConnectionRefusedError:
+                        pass
+
+            def send_segmented(first, end, length):
+                """Send a run of equal-length packets as one GSO sendmsg()"""
+                try:
+                    self.sock.sendmsg([mv[start:stop] for start, stop in spans[first:end]],
+                                      [(SOL_UDP, UDP_SEGMENT, _SEGMENT_SIZE.pack(length))])
+                except ConnectionRefusedError:
+                    pass
+                except OSError:
+                    self.gso = False  # Kernel/route refused GSO, stop trying
+                    send_each(first, end)
 
-                # Send the packet
-                self.sock.sendto(packet_data, target)
-                packets_sent += 1
-                last_timestamp = timestamp
+            print(f"\n▶️  Starting playback...\n")
+            start_time = time.time()
+            start_ns = time.perf_counter_ns()
+
+            pending_first = pending_end = None  # overdue packets not sent yet
+
+            for first, end, deadline_ns, segment in groups:
+                # Wait for the batch's deadline (adjusted by speed multiplier), measured
+                # from the start of playback so sleep overshoot never accumulates. Only a
+                # deadline still ahead ends the drain: overdue groups keep accumulating
+                if deadline_ns is not None and time.perf_counter_ns() < start_ns + deadline_ns:
+                    if pending_first is not None:
+                        send_each(pending_first, pending_end)
+                        pending_first = None
+                    wait_until(start_ns + deadline_ns)
+
+                if segment and self.gso:
+                    if pending_first is not None:
+                        send_each(pending_first, pending_end)
+                        pending_first = None
+                    send_segmented(first, end, segment)
+                elif pending_first is not None and end - pending_first <= DRAIN_BATCH:
+                    pending_end = end  # Groups are contiguous, extend the burst
+                else:
+                    if pending_first is not None:
+                        send_each(pending_first, pending_end)
+                    pending_first, pending_end = first, end
 
                 # Progress indicator
-                if packets_sent % 100 == 0:
+                if end // 100 > packets_sent // 100:
                     elapsed = time.time() - start_time
-                    print(f"📤 Sent {packets_sent} packets "
-                          f"(@ {timestamp:.1f}s in recording, "
+                    print(f"📤 Sent {end} packets "
+                          f"(@ {timestamps[end - 1]:.1f}s in recording, "
                           f"{elapsed:.1f}s real time)")
+                packets_sent = end
+                last_timestamp = timestamps[end - 1]
+
+            if pending_first is not None:
+                send_each(pending_first, pending_end)
+        finally:
+            del anchor
+            if mm is not None:
+                mv.release()
+                mm.close()
 
         elapsed = time.time() - start_time
         print("\n" + "=" * 60)
@@ -13,20 +13,359 @@ To replay later, use f1-cli:
     f1-cli play my_race.bin --port 20777
 """
 
+import ctypes
+import ctypes.util
+import errno
+import mmap
+import os
+import platform
 import socket
+import sys
 import time
 import argparse
 import struct
 from datetime import datetime
 
+# Datagrams drained per recvmmsg() call, and the largest F1 packet we expect
+RECV_BATCH = 32
+RECV_BUFFER_SIZE = 2048
+
+MSG_WAITFORONE = 0x10000
+
+# Kernel receive queue requested for the socket, enough to ride out stalls during packet bursts
+RECV_SOCKET_BUFFER = 64 * 1024 * 1024
+SO_RCVBUFFORCE = 33  # Linux; not exported by the socket module
+
+
+def receive_buffer_size(sock):
+    """Usable SO_RCVBUF of a socket (Linux reports double, bookkeeping overhead included)"""
+    size = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    if sys.platform.startswith("linux"):
+        size //= 2
+    return size
+
+
+# Recording file layout: [timestamp <d][length <I][payload] per packet
+_HDR = struct.Struct('<dI')
+
+# The output file is mapped in chunks of this size and grown by doubling
+INITIAL_MAP_SIZE = 256 * 1024 * 1024
+
+# Written pages are synced and dropped from memory every WRITEBACK_INTERVAL bytes, so dirty
+# pages never pile up into a kernel write-back stall during long sessions
+WRITEBACK_INTERVAL = 16 * 1024 * 1024
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+# recvmmsg(2) is Linux-only; other platforms fall back to one recvfrom() per packet
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.recvmmsg.argtypes = [
+            ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p
+        ]
+        _libc.recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc = None
+RECVMMSG_AVAILABLE = _libc is not None
+
+
+class RecvBatch:
+    """Persistent recvmmsg() buffers: one receive call fills up to `size` datagrams"""
+
+    def __init__(self, size=RECV_BATCH, buffer_size=RECV_BUFFER_SIZE):
+        self.size = size
+        self.buffers = [ctypes.create_string_buffer(buffer_size) for _ in range(size)]
+        self.views = [memoryview(buf).cast('B') for buf in self.buffers]
+        self.iovecs = (_IOVec * size)()
+        self.msgs = (_MMsgHdr * size)()
+        for i, buf in enumerate(self.buffers):
+            self.iovecs[i].iov_base = ctypes.addressof(buf)
+            self.iovecs[i].iov_len = buffer_size
+            self.msgs[i].msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            self.msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self, fd):
+        """Block until at least one datagram arrives, then return how many were received"""
+        while True:
+            n = _libc.recvmmsg(fd, self.msgs, self.size, MSG_WAITFORONE, None)
+            if n >= 0:
+                return n
+            err = ctypes.get_errno()
+            if err != errno.EINTR:
+                raise OSError(err, os.strerror(err))
+            # EINTR: Ctrl+C surfaces as KeyboardInterrupt here; other signals just retry
+
+    def packet(self, i):
+        """Payload of the i-th datagram from the last recv()"""
+        return self.views[i][:self.msgs[i].msg_len]
+
+
+# io_uring (opt-in, Linux 6.0+ on x86-64): one multishot recv keeps delivering datagrams
+# into a ring of buffers we hand to the kernel, so steady-state capture needs no syscall
+# per packet. Rings are driven through raw syscalls, like recvmmsg() above; x86-64 only
+# because ctypes offers no memory barriers and x86's ordering makes them unnecessary
+URING_BUFFERS = 256  # provided buffers, power of two
+URING_BUFFER_GROUP = 0
+
+_SYS_IO_URING_SETUP = 425
+_SYS_IO_URING_ENTER = 426
+_SYS_IO_URING_REGISTER = 427
+IORING_SETUP_CQSIZE = 1 << 3
+IORING_SETUP_COOP_TASKRUN = 1 << 8
+IORING_SETUP_SINGLE_ISSUER = 1 << 12
+IORING_SETUP_DEFER_TASKRUN = 1 << 13
+IORING_FEAT_SINGLE_MMAP = 1 << 0
+IORING_OFF_SQES = 0x10000000
+IORING_ENTER_GETEVENTS = 1 << 0
+IORING_REGISTER_PBUF_RING = 22
+IORING_OP_RECV = 27
+IORING_RECV_MULTISHOT = 1 << 1
+IOSQE_BUFFER_SELECT = 1 << 5
+IORING_CQE_F_BUFFER = 1 << 0
+IORING_CQE_F_MORE = 1 << 1
+IORING_CQE_BUFFER_SHIFT = 16
+
+_SQE = struct.Struct('<BBHiQQIIQHHiQQ')  # struct io_uring_sqe (64 bytes)
+_CQE = struct.Struct('<QiI')  # struct io_uring_cqe: user_data, res, flags
+_BUF = struct.Struct('<QIH')  # struct io_uring_buf without resv (entry 0's resv is the ring tail)
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+
+
+class _SQRingOffsets(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        "head", "tail", "ring_mask", "ring_entries", "flags", "dropped", "array", "resv1"
+    )] + [("user_addr", ctypes.c_uint64)]
+
+
+class _CQRingOffsets(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        "head", "tail", "ring_mask", "ring_entries", "overflow", "cqes", "flags", "resv1"
+    )] + [("user_addr", ctypes.c_uint64)]
+
+
+class _UringParams(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        "sq_entries", "cq_entries", "flags", "sq_thread_cpu", "sq_thread_idle", "features", "wq_fd"
+    )] + [("resv", ctypes.c_uint32 * 3), ("sq_off", _SQRingOffsets), ("cq_off", _CQRingOffsets)]
+
+
+class _UringBufReg(ctypes.Structure):
+    _fields_ = [
+        ("ring_addr", ctypes.c_uint64),
+        ("ring_entries", ctypes.c_uint32),
+        ("bgid", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("resv", ctypes.c_uint64 * 3),
+    ]
+
+
+if _libc is not None:
+    _libc.syscall.restype = ctypes.c_long
+
+
+def _kernel_at_least(major, minor):
+    try:
+        version = tuple(int(part) for part in platform.release().split("-")[0].split(".")[:2])
+    except ValueError:
+        return False
+    return version >= (major, minor)
+
+
+IO_URING_AVAILABLE = (_libc is not None and platform.machine() == "x86_64"
+                      and _kernel_at_least(6, 0))
+
+
+def _uring_call(number, *args):
+    """Raw io_uring syscall, raising OSError on failure (EINTR included)"""
+    result = _libc.syscall(ctypes.c_long(number), *args)
+    if result < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return result
+
+
+class UringRecv:
+    """io_uring multishot recv on one socket, with kernel-selected buffers from a provided ring"""
+
+    def __init__(self, sock_fd, entries=URING_BUFFERS, buffer_size=RECV_BUFFER_SIZE):
+        self.sock_fd = sock_fd
+        self.buffer_size = buffer_size
+        self.fd = None
+        self._mappings = []
+        self._anchors = []
+
+        # A completion slot per provided buffer, so a full burst never overflows the CQ
+        # (which would end the multishot recv)
+        params = _UringParams()
+        params.flags = (IORING_SETUP_CQSIZE | IORING_SETUP_SINGLE_ISSUER
+                        | IORING_SETUP_COOP_TASKRUN | IORING_SETUP_DEFER_TASKRUN)
+        params.cq_entries = entries
+        try:
+            self.fd = _uring_call(_SYS_IO_URING_SETUP, ctypes.c_uint(8), ctypes.byref(params))
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+            params = _UringParams()  # Older kernel: no task-run tuning flags
+            params.flags = IORING_SETUP_CQSIZE
+            params.cq_entries = entries
+            self.fd = _uring_call(_SYS_IO_URING_SETUP, ctypes.c_uint(8), ctypes.byref(params))
+
+        try:
+            if not params.features & IORING_FEAT_SINGLE_MMAP:
+                raise OSError(errno.ENOSYS, "io_uring without IORING_FEAT_SINGLE_MMAP")
+            self.sq_off = params.sq_off
+            self.cq_off = params.cq_off
+            ring_size = max(params.sq_off.array + params.sq_entries * 4,
+                            params.cq_off.cqes + params.cq_entries * _CQE.size)
+            self.ring = self._map(self.fd, ring_size, 0)
+            self.sqes = self._map(self.fd, params.sq_entries * _SQE.size, IORING_OFF_SQES)
+            self.sq_mask = _U32.unpack_from(self.ring, self.sq_off.ring_mask)[0]
+            self.cq_mask = _U32.unpack_from(self.ring, self.cq_off.ring_mask)[0]
+
+            # Provided buffers: one anonymous region split into `entries` slots, announced to
+            # the kernel through a page-aligned ring of (addr, len, bid) entries
+            self.entries = entries
+            self.buffers = self._map(-1, entries * buffer_size)
+            self.views = memoryview(self.buffers)
+            self.buf_ring = self._map(-1, entries * 16)
+            self.buffers_address = self._address(self.buffers)
+            self.buf_tail = 0
+            self._provide(range(entries))
+
+            reg = _UringBufReg()
+            reg.ring_addr = self._address(self.buf_ring)
+            reg.ring_entries = entries
+            reg.bgid = URING_BUFFER_GROUP
+            _uring_call(_SYS_IO_URING_REGISTER, ctypes.c_int(self.fd),
+                        ctypes.c_uint(IORING_REGISTER_PBUF_RING), ctypes.byref(reg), ctypes.c_uint(1))
+
+            self.armed = False
+            self._arm()
+        except BaseException:
+            self.close()
+            raise
+
+    def _map(self, fd, size, offset=0):
+        mapping = mmap.mmap(fd, size, mmap.MAP_SHARED if fd >= 0 else mmap.MAP_PRIVATE,
+                            mmap.PROT_READ | mmap.PROT_WRITE, offset=offset)
+        self._mappings.append(mapping)
+        return mapping
+
+    def _address(self, mapping):
+        anchor = ctypes.c_char.from_buffer(mapping)
+        self._anchors.append(anchor)
+        return ctypes.addressof(anchor)
+
+    def _enter(self, to_submit, min_complete, flags):
+        return _uring_call(_SYS_IO_URING_ENTER, ctypes.c_int(self.fd), ctypes.c_uint(to_submit),
+                           ctypes.c_uint(min_complete), ctypes.c_uint(flags), None, ctypes.c_size_t(0))
+
+    def _arm(self):
+        """Queue the multishot recv; it keeps completing until it runs out of buffers"""
+        tail = _U32.unpack_from(self.ring, self.sq_off.tail)[0]
+        index = tail & self.sq_mask
+        _SQE.pack_into(self.sqes, index * _SQE.size,
+                       IORING_OP_RECV, IOSQE_BUFFER_SELECT, IORING_RECV_MULTISHOT, self.sock_fd,
+                       0, 0, 0, 0, 0, URING_BUFFER_GROUP, 0, 0, 0, 0)
+        _U32.pack_into(self.ring, self.sq_off.array + index * 4, index)
+        _U32.pack_into(self.ring, self.sq_off.tail, (tail + 1) & 0xFFFFFFFF)
+        self._enter(1, 0, 0)
+        self.armed = True
+
+    def wait(self):
+        """Block for at least one datagram, return [(buffer id, length)] for everything queued"""
+        while True:
+            try:
+                self._enter(0, 1, IORING_ENTER_GETEVENTS)
+            except OSError as e:
+                if e.errno != errno.EINTR:
+                    raise
+                # EINTR: Ctrl+C surfaces as KeyboardInterrupt here; other signals just retry
+            head = _U32.unpack_from(self.ring, self.cq_off.head)[0]
+            tail = _U32.unpack_from(self.ring, self.cq_off.tail)[0]
+            if head != tail:
+                break
+
+        completions = []
+        for position in range(head, head + ((tail - head) & 0xFFFFFFFF)):
+            user_data, res, flags = _CQE.unpack_from(
+                self.ring, self.cq_off.cqes + (position & self.cq_mask) * _CQE.size)
+            if not flags & IORING_CQE_F_MORE:
+                self.armed = False  # Multishot ended (e.g. ENOBUFS), re-armed after recycling
+            if res < 0 and -res != errno.ENOBUFS:
+                raise OSError(-res, os.strerror(-res))
+            if flags & IORING_CQE_F_BUFFER:
+                completions.append((flags >> IORING_CQE_BUFFER_SHIFT, max(res, 0)))
+        _U32.pack_into(self.ring, self.cq_off.head, tail)
+        return completions
+
+    def packet(self, buffer_id, length):
+        """Payload held in a provided buffer"""
+        start = buffer_id * self.buffer_size
+        return self.views[start:start + length]
+
+    def recycle(self, buffer_ids):
+        """Hand buffers back to the kernel, re-arming the recv if it had stopped"""
+        self._provide(buffer_ids)
+        if not self.armed:
+            self._arm()
+
+    def _provide(self, buffer_ids):
+        """Add buffers to the provided-buffer ring and publish its new tail"""
+        mask = self.entries - 1
+        for buffer_id in buffer_ids:
+            _BUF.pack_into(self.buf_ring, (self.buf_tail & mask) * 16,
+                           self.buffers_address + buffer_id * self.buffer_size, self.buffer_size, buffer_id)
+            self.buf_tail += 1
+        _U16.pack_into(self.buf_ring, 14, self.buf_tail & 0xFFFF)
+
+    def close(self):
+        if hasattr(self, "views"):
+            self.views.release()
+        self._anchors.clear()
+        for mapping in self._mappings:
+            mapping.close()
+        self._mappings.clear()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
 class TelemetryRecorder:
-    def __init__(self, port=20777, output_file="recording.bin"):
+    def __init__(self, port=20777, output_file="recording.bin", io_uring=False):
         self.port = port
         self.output_file = output_file
+        self.io_uring = io_uring
+        self.uring = None
         self.sock = None
         self.file = None
+        self.mm = None
+        self.pos = 0
+        self.synced = 0
         self.packet_count = 0
-        self.start_time = None
+        self.start_ns = None
 
     def start(self):
         """Start recording telemetry"""
@@ -42,57 +381,185 @@ class TelemetryRecorder:
         print("🛑 Press Ctrl+C to stop recording\n")
 
         try:
-            # Create UDP socket
+            # Create UDP socket. A single socket is deliberate: the game sends one UDP flow,
+            # which SO_REUSEPORT would hash onto one socket anyway, and a shared port would let
+            # another process bind it and take part of the stream
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.sock.bind(('', self.port))
-            self.sock.settimeout(1.0)  # 1 second timeout for Ctrl+C responsiveness
+            self._enlarge_receive_buffer()
 
-            # Open output file
-            self.file = open(self.output_file, 'wb')
-            self.start_time = time.time()
+            # Open output file and map a preallocated region of it; packets are copied
+            # straight into the page cache instead of going through the buffered writer
+            self.file = open(self.output_file, 'w+b')
+            os.ftruncate(self.file.fileno(), INITIAL_MAP_SIZE)
+            self.mm = mmap.mmap(self.file.fileno(), INITIAL_MAP_SIZE)
+            self.pos = 0
+            self.synced = 0
+            self.start_ns = time.monotonic_ns()  # immune to NTP/DST wall-clock steps
 
             # Record loop
-            while True:
-                try:
-                    data, addr = self.sock.recvfrom(2048)
+            if self.io_uring:
+                self.uring = self._open_uring()
+            if self.uring is not None:
+                self._record_uring()
+            elif RECVMMSG_AVAILABLE:
+                self._record_batched()
+            else:
+                self._record_single()
 
-                    # Write timestamp + packet length + packet data
-                    timestamp = time.time() - self.start_time
-                    packet_length = len(data)
+        except KeyboardInterrupt:
+            print("\n\n🛑 Recording stopped by user")
 
-                    # Format: [timestamp (8 bytes)] [length (4 bytes)] [data]
-                    self.file.write(struct.pack('<d', timestamp))  # double
-                    self.file.write(struct.pack('<I', packet_length))  # unsigned int
-                    self.file.write(data)
+        finally:
+            self.stop()
 
-                    self.packet_count += 1
+    def _enlarge_receive_buffer(self):
+        """Grow SO_RCVBUF so bursts queue in the kernel instead of being dropped"""
+        forced = False
+        if sys.platform.startswith("linux"):
+            # SO_RCVBUFFORCE ignores net.core.rmem_max but needs CAP_NET_ADMIN
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, RECV_SOCKET_BUFFER)
+                forced = True
+            except OSError:
+                pass
+        if not forced:
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_SOCKET_BUFFER)
+            except OSError:
+                pass
 
-                    # Progress indicator
-                    if self.packet_count % 100 == 0:
-                        elapsed = time.time() - self.start_time
-                        print(f"📦 Recorded {self.packet_count} packets "
-                              f"({elapsed:.1f}s elapsed, "
-                              f"{self.packet_count/elapsed:.1f} packets/sec)")
+        actual = receive_buffer_size(self.sock)
+        if actual < RECV_SOCKET_BUFFER:
+            print(f"⚠️  Receive buffer capped at {actual // 1024} KiB "
+                  f"(requested {RECV_SOCKET_BUFFER // 1024} KiB); "
+                  f"raise it with: sysctl -w net.core.rmem_max={RECV_SOCKET_BUFFER}")
 
-                except socket.timeout:
-                    # Just continue - this allows Ctrl+C to work
-                    pass
+    def _open_uring(self):
+        """Set up io_uring receive, or return None to fall back to recvmmsg()"""
+        if not IO_URING_AVAILABLE:
+            print("⚠️  io_uring needs Linux 6.0+ on x86-64, using recvmmsg() instead")
+            return None
+        try:
+            return UringRecv(self.sock.fileno())
+        except OSError as e:
+            print(f"⚠️  io_uring unavailable ({e}), using recvmmsg() instead")
+            return None
 
-        except KeyboardInterrupt:
-            print("\n\n🛑 Recording stopped by user")
+    def _record_uring(self):
+        """Record loop fed by io_uring completions; buffers go back to the kernel after copying"""
+        while True:
+            completions = self.uring.wait()
+            self._append_packets(self._elapsed(),
+                                 [self.uring.packet(buffer_id, length) for buffer_id, length in completions])
+            self.uring.recycle([buffer_id for buffer_id, _ in completions])
 
-        finally:
-            self.stop()
+    def _record_batched(self):
+        """Record loop draining up to RECV_BATCH queued datagrams per syscall (Linux)"""
+        # Blocking socket: recvmmsg waits for the first datagram, Ctrl+C interrupts it (EINTR)
+        self.sock.setblocking(True)
+        batch = RecvBatch()
+        fd = self.sock.fileno()
+
+        while True:
+            n = batch.recv(fd)
+            self._append_packets(self._elapsed(), [batch.packet(i) for i in range(n)])
+
+    def _record_single(self):
+        """Record loop with one recv_into() per packet, straight into the mapped file"""
+        self.sock.settimeout(1.0)  # 1 second timeout for Ctrl+C responsiveness
+
+        while True:
+            start = self.pos + _HDR.size
+            self._ensure_capacity(start + RECV_BUFFER_SIZE)
+            try:
+                with memoryview(self.mm) as view:
+                    packet_length = self.sock.recv_into(view[start:start + RECV_BUFFER_SIZE])
+
+            except socket.timeout:
+                # Just continue - this allows Ctrl+C to work
+                continue
+
+            _HDR.pack_into(self.mm, self.pos, self._elapsed(), packet_length)
+            self.pos = start + packet_length
+            self._packets_recorded()
+
+    def _append_packets(self, timestamp, packets):
+        """Append a batch of packets received together, all stamped with `timestamp`"""
+        pack_header = _HDR.pack_into
+        header_size = _HDR.size
+
+        # Room for the whole batch up front, then each packet is one header pack_into plus
+        # one payload copy straight into the mapping
+        self._ensure_capacity(self.pos + len(packets) * (header_size + RECV_BUFFER_SIZE))
+        mm = self.mm
+        pos = self.pos
+        for packet in packets:
+            start = pos + header_size
+            pos = start + len(packet)
+
+            # Format: [timestamp (8 bytes)] [length (4 bytes)] [data]
+            pack_header(mm, start - header_size, timestamp, len(packet))
+            mm[start:pos] = packet
+        self.pos = pos
+        self._packets_recorded(len(packets))
+
+    def _elapsed(self):
+        """Seconds since recording started, from the monotonic clock"""
+        return (time.monotonic_ns() - self.start_ns) / 1e9
+
+    def _ensure_capacity(self, end):
+        """Grow the mapping so it covers at least `end` bytes"""
+        if end > len(self.mm):
+            # Double the mapping; resize() also extends the file underneath it
+            self.mm.resize(max(len(self.mm) * 2, end))
+
+    def _packets_recorded(self, count=1):
+        """Count recorded packets and report progress"""
+        previous = self.packet_count
+        self.packet_count += count
+
+        # Progress indicator
+        if self.packet_count // 100 > previous // 100:
+            elapsed = self._elapsed()
+            print(f"📦 Recorded {self.packet_count} packets "
+                  f"({elapsed:.1f}s elapsed, "
+                  f"{self.packet_count/elapsed:.1f} packets/sec)")
+
+        if self.pos - self.synced >= WRITEBACK_INTERVAL:
+            self._write_back()
+
+    def _write_back(self):
+        """Sync fully written pages to disk, then drop them from the mapping and page cache"""
+        end = self.pos - self.pos % mmap.PAGESIZE
+        start, length = self.synced, end - self.synced
+        self.mm.flush(start, length)
+        if hasattr(self.mm, 'madvise'):
+            self.mm.madvise(mmap.MADV_DONTNEED, start, length)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(self.file.fileno(), start, length, os.POSIX_FADV_DONTNEED)
+        self.synced = end
 
     def stop(self):
         """Stop recording and cleanup"""
+        if self.uring:
+            self.uring.close()
+            self.uring = None
+
         if self.sock:
             self.sock.close()
 
+        if self.mm:
+            # Flush the mapping and cut the preallocated tail off the file
+            self.mm.flush()
+            self.mm.close()
+            self.mm = None
+            os.ftruncate(self.file.fileno(), self.pos)
+
         if self.file:
             self.file.close()
 
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = self._elapsed() if self.start_ns is not None else 0
 
         print("\n" + "=" * 60)
         print("📊 RECORDING SUMMARY")
@@ -132,9 +599,15 @@ def main():
         help='UDP port to listen on (default: 20777)'
     )
 
+    parser.add_argument(
+        '--io-uring',
+        action='store_true',
+        help='Receive through io_uring multishot recv (Linux 6.0+, x86-64; falls back to recvmmsg)'
+    )
+
     args = parser.parse_args()
 
-    recorder = TelemetryRecorder(port=args.port, output_file=args.output)
+    recorder = TelemetryRecorder(port=args.port, output_file=args.output, io_uring=args.io_uring)
     recorder.start()
 
 if __name__ == "__main__":
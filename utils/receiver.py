@@ -1,70 +1,169 @@
 import socket
-import pickle
+import sys
+import struct
 import threading
+import queue
+import selectors
+import signal
 import os
+import time
 import datetime
 
+try:
+    from telemetry_recorder import SO_RCVBUFFORCE, receive_buffer_size
+except ImportError:
+    # Run as a script from utils/ : the recorder lives in the parent folder
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from telemetry_recorder import SO_RCVBUFFORCE, receive_buffer_size
+
 PORT = 20777
-string = ""
 
 REDIRECT = True
 REDIRECT_PORT = 20790
 REDIRECT_ADDRESS = "127.0.0.1"
 
-socket_recv = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
-socket_send = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+# Large kernel receive queue so packet bursts aren't dropped while Python catches up
+RECV_BUFFER = 64 * 1024 * 1024
 
-socket_recv.bind(('', PORT))
-socket_recv.setblocking(False)
+# The receiving thread frames packets straight into CHUNK_SIZE buffers with recv_into(), and
+# hands each filled buffer to the writer thread and each packet (a memoryview) to the redirect
+# thread. Buffers are never reused, so the views stay valid until both consumers drop them.
+# None ends the consumer threads.
+CHUNK_SIZE = 1 << 22
+MAX_PACKET = 2048
+HEADER = struct.Struct('<dI')
 
-current_time = str(datetime.datetime.now())
 
-PATH = "E:/Data_samples/F1 25/" + current_time.split(".")[0].replace(":", "-")
+def pin(index):
+    """Pin the calling thread to one of the allowed CPUs (Linux only, best effort)"""
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        try:
+            os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+        except OSError:
+            pass
 
-if os.path.isfile(PATH):
-    print(f"WARNING : The file {PATH} already exists, it will be overwritten if you continue.")
-    chaine = input("Continue ? [y|N]")
-    if chaine in ["y", "Y"]:
-        print(f"The file {PATH} will be overwritten.")
-    else:
-        print(f"Please change the PATH variable if you don't want the {PATH} file to be overwritten, and re-run the program.")
-        socket_recv.close()
-        socket_send.close()
-        exit(0)
 
-file = open(PATH, 'wb')
-file.close()
+def open_receive_socket():
+    socket_recv = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    socket_recv.bind(('', PORT))
 
-def main():
-    L=[]
-    while string!="stop":
+    forced = False
+    if sys.platform.startswith("linux"):
         try:
-            packet = socket_recv.recv(2048)
-            L.append(packet)
-            if REDIRECT:
-                socket_send.sendto(packet, (REDIRECT_ADDRESS, REDIRECT_PORT))
-        except BlockingIOError:
+            socket_recv.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, RECV_BUFFER)  # needs CAP_NET_ADMIN
+            forced = True
+        except OSError:
             pass
-    print(f"\nRecording finished : Storing {len(L)} packets in {PATH}, this may take a few time, please wait")
-    file = open(PATH, 'wb')
-    pickle.dump(L, file)
+    if not forced:
+        socket_recv.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER)
+    if receive_buffer_size(socket_recv) < RECV_BUFFER:
+        print(f"WARNING : UDP receive buffer capped below {RECV_BUFFER >> 20} MiB, raise net.core.rmem_max to avoid drops")
+    socket_recv.setblocking(False)  # Drained after each selector wake-up until it would block
+    return socket_recv
+
+
+def receive(socket_recv, write_queue, send_queue, stop, t0):
+    pin(0)
+    selector = selectors.DefaultSelector()  # epoll on Linux
+    selector.register(socket_recv, selectors.EVENT_READ)
+    view = memoryview(bytearray(CHUNK_SIZE))
+    pos = 0
+    count = 0
+    while not stop.is_set():
+        # Sleep until packets arrive, waking up regularly to check for Ctrl+C
+        if not selector.select(timeout=0.5):
+            continue
+        while True:
+            if pos > CHUNK_SIZE - HEADER.size - MAX_PACKET:
+                write_queue.put((view[:pos], count))
+                view = memoryview(bytearray(CHUNK_SIZE))
+                pos = 0
+                count = 0
+            start = pos + HEADER.size
+            try:
+                length = socket_recv.recv_into(view[start:start + MAX_PACKET])
+            except BlockingIOError:
+                break
+            HEADER.pack_into(view, pos, time.monotonic() - t0, length)
+            pos = start + length
+            count += 1
+            if REDIRECT:
+                send_queue.put(view[start:pos])
+    selector.close()
+    write_queue.put((view[:pos], count))
+    write_queue.put(None)
+    send_queue.put(None)
+
+
+def write(file, path, write_queue):
+    pin(1)
+    count = 0
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        chunk, packets = item
+        file.write(chunk)
+        count += packets
+    file.flush()
+    os.fsync(file.fileno())
     file.close()
-    print(f"\nDatas stored in {PATH} with success !")
-    socket_recv.close()
-    socket_send.close()
-    exit(0)
-
+    print(f"\nRecording finished : {count} packets stored in {path}")
 
-def inp():
-    global string
-    while string!="stop":
-        string = input("Enter 'stop' to stop the data recording")
 
-t1=threading.Thread(target=main)
-t2=threading.Thread(target=inp)
-t1.start()
-t2.start()
+def redirect(socket_send, send_queue):
+    pin(2)
+    while True:
+        packet = send_queue.get()
+        if packet is None:
+            break
+        socket_send.sendto(packet, (REDIRECT_ADDRESS, REDIRECT_PORT))
 
 
+def main():
+    current_time = str(datetime.datetime.now())
+
+    path = "E:/Data_samples/F1 25/" + current_time.split(".")[0].replace(":", "-")
+
+    if os.path.isfile(path):
+        print(f"WARNING : The file {path} already exists, it will be overwritten if you continue.")
+        chaine = input("Continue ? [y|N]")
+        if chaine in ["y", "Y"]:
+            print(f"The file {path} will be overwritten.")
+        else:
+            print(f"Please change the path if you don't want the {path} file to be overwritten, and re-run the program.")
+            return
+
+    socket_recv = open_receive_socket()
+    socket_send = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+
+    # Same framing as telemetry_recorder.py : [timestamp <d][length <I][packet]
+    file = open(path, 'wb', buffering=1 << 20)
+
+    # Packets flow from the receiving thread to the writer and redirect threads
+    write_queue = queue.SimpleQueue()
+    send_queue = queue.SimpleQueue()
+
+    # Ctrl+C stops the recording; the threads finish writing before the program exits
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    print("Recording, press Ctrl+C to stop")
+
+    threads = [
+        threading.Thread(target=receive, args=(socket_recv, write_queue, send_queue, stop, time.monotonic())),
+        threading.Thread(target=write, args=(file, path, write_queue)),
+        threading.Thread(target=redirect, args=(socket_send, send_queue)),
+    ]
+    for thread in threads:
+        thread.start()
+    # Timed joins : an untimed join can't be interrupted by Ctrl+C on Windows (before Python 3.14)
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(timeout=0.5)
+    socket_recv.close()
+    socket_send.close()
 
 
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,62 @@
 import socket
-import pickle
+import struct
 import time
 import sys
+import os
+import mmap
+import array
 
 my_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
 PORT = 20777
 if len(sys.argv)>1:
     PORT = int(sys.argv[1])
+my_socket.connect(("127.0.0.1", PORT))  # Resolve the destination once instead of per sendto()
 
-with open('../2025-06-01 17-47-20', 'rb') as file:
-    b = pickle.load(file)
-i=200_000
+PATH = '../2025-06-01 17-47-20'
 
+# Recordings use the telemetry_recorder.py framing : [timestamp <d][length <I][packet]
+# (pickled packet lists written by the old receiver can't be replayed)
+header = struct.Struct('<dI')
+
+# One packet every PERIOD_NS, paced on absolute deadlines : sleep while far away, then spin
+PERIOD_NS = 1_000_000
+SPIN_NS = 200_000
+
+file = open(PATH, 'rb')
+if os.fstat(file.fileno()).st_size == 0:  # mmap can't map an empty file
+    print(f"{PATH} is empty (aborted recording ?), nothing to send")
+    sys.exit(1)
+mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+mv = memoryview(mm)
+
+# Index the recording once : 12 bytes of metadata per packet, payloads stay in the page cache
+offsets = array.array('Q')
+lengths = array.array('I')
+off = 0
+while off + header.size <= len(mm):
+    timestamp, length = header.unpack_from(mm, off)
+    off += header.size
+    if off + length > len(mm):
+        break
+    offsets.append(off)
+    lengths.append(length)
+    off += length
+
+if not offsets:
+    print(f"No packets in {PATH}")
+    sys.exit(1)
+
+i = 0
+deadline = time.perf_counter_ns()
 while True:
-    i = (i + 1) % len(b)
-    my_socket.sendto(b[i], ("127.0.0.1", PORT))
-    time.sleep(0.001)
\ No newline at end of file
+    try:
+        my_socket.send(mv[offsets[i]:offsets[i] + lengths[i]])
+    except ConnectionRefusedError:
+        pass  # Nothing listening yet (ICMP port unreachable), keep streaming
+    i = (i + 1) % len(offsets)
+    deadline += PERIOD_NS
+    remaining = deadline - time.perf_counter_ns()
+    if remaining > SPIN_NS:
+        time.sleep((remaining - SPIN_NS) / 1e9)
+    while time.perf_counter_ns() < deadline:
+        pass